@@ -10,11 +10,94 @@ import os
 import json
 import argparse
 import logging
+import functools
+import concurrent.futures
+from collections import defaultdict
 from typing import Dict, Any, List, Set, Tuple, Optional
 from pathlib import Path
 
+from prismtm.version import version_key
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib json parser
+    orjson = None
+
+# Edit-distance backends are optional, tried fastest first: stringzilla, rapidfuzz,
+# then the pure-Python implementation below
+try:
+    # StringZilla 4 moved edit distance out into the separate stringzillas package
+    from stringzilla import edit_distance as _sz_edit_distance
+except ImportError:
+    _sz_edit_distance = None
+
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    Levenshtein = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def _py_levenshtein_distance(s1: str, s2: str) -> int:
+    """Pure-Python Wagner-Fischer edit distance, used when no native backend is installed."""
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if len(s2) == 0:
+        return len(s1)
+
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+
+    return previous_row[-1]
+
+def levenshtein_distance(s1: str, s2: str) -> int:
+    """Levenshtein distance between two strings, using the fastest installed backend."""
+    # stringzilla measures bytes, which only matches character distance for ASCII
+    if _sz_edit_distance is not None and s1.isascii() and s2.isascii():
+        return _sz_edit_distance(s1, s2)
+    if Levenshtein is not None:
+        return Levenshtein.distance(s1, s2)
+    return _py_levenshtein_distance(s1, s2)
+
+@functools.lru_cache(maxsize=4096)
+def _field_similarity(field1: str, field2: str) -> float:
+    """Cached normalized similarity; callers pass lowercased names in canonical order."""
+    max_len = max(len(field1), len(field2))
+    if max_len == 0:
+        return 0
+    return 1 - (levenshtein_distance(field1, field2) / max_len)
+
+NO_CHANGES_CODE = "        # No changes needed"
+
+def _type_key(field_type: Any) -> Any:
+    """Hashable form of a JSON Schema "type" value (which may be a list)."""
+    return tuple(field_type) if isinstance(field_type, list) else field_type
+
+def _definition_changed(from_def: Dict[str, Any], to_def: Dict[str, Any]) -> bool:
+    """Compare two property definitions, ignoring nested "properties".
+
+    Nested properties are diffed under their own paths, so re-walking them
+    here would only repeat that work.
+    """
+    if from_def.keys() - {"properties"} != to_def.keys() - {"properties"}:
+        return True
+    return any(from_def[key] != to_def[key] for key in from_def if key != "properties")
+
+def _lowered_similarity(field1: str, field2: str) -> float:
+    """Similarity of two already-lowercased names."""
+    # Edit distance is symmetric, so (a, b) and (b, a) share a cache slot
+    if field2 < field1:
+        field1, field2 = field2, field1
+    return _field_similarity(field1, field2)
+
 class SchemaDiff:
     """Represents the differences between two schema versions."""
 
@@ -27,24 +110,46 @@ class SchemaDiff:
         self.renamed_fields: Dict[str, Tuple[str, str]] = {}  # old_name -> new_name
         self.type_changes: Dict[str, Tuple[str, str]] = {}  # field -> (old_type, new_type)
         self.enum_changes: Dict[str, Tuple[List[str], List[str]]] = {}  # field -> (old_values, new_values)
+        self.enum_maps: Dict[str, Dict[str, str]] = {}  # field -> {old_value: new_value}
+        self.enum_maps_reverse: Dict[str, Dict[str, str]] = {}  # field -> {new_value: old_value}
         self.structural_changes: List[str] = []
 
 class MigrationGenerator:
     """Generates migration scripts by comparing schema versions."""
 
-    def __init__(self, schemas_dir: str = "schemas"):
+    def __init__(self, schemas_dir: str = "schemas", jobs: Optional[int] = None):
         self.schemas_dir = Path(schemas_dir)
+        self.jobs = jobs
         self.migrations_dir = self.schemas_dir / "migrations"
         self.migrations_dir.mkdir(exist_ok=True)
+        # Each schema file is parsed once per run; vN is both "to" and "from" across adjacent pairs
+        self._schema_cache: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        self._schema_names_cache: Dict[str, Set[str]] = {}
+        self._versions_cache: Optional[List[str]] = None
+        self._version_dirs: Dict[str, str] = {}
+        self._properties_cache: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
 
     def load_schema(self, version: str, schema_name: str) -> Optional[Dict[str, Any]]:
         """Load a specific schema file for a given version."""
-        schema_path = self.schemas_dir / version / f"{schema_name}.schema.json"
-        if not schema_path.exists():
+        key = (version, schema_name)
+        if key not in self._schema_cache:
+            self._schema_cache[key] = self._read_schema(version, schema_name)
+        return self._schema_cache[key]
+
+    def _read_schema(self, version: str, schema_name: str) -> Optional[Dict[str, Any]]:
+        """Read and parse a schema file from disk."""
+        version_dir = self._version_dirs.get(version)
+        if version_dir is None:
+            version_dir = self._version_dirs[version] = os.path.join(self.schemas_dir, version)
+        schema_path = os.path.join(version_dir, schema_name + ".schema.json")
+        if not os.path.isfile(schema_path):
             logging.warning(f"Schema not found: {schema_path}")
             return None
 
         try:
+            if orjson is not None:
+                with open(schema_path, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(schema_path, 'r') as f:
                 return json.load(f)
         except Exception as e:
@@ -53,137 +158,174 @@ class MigrationGenerator:
 
     def get_available_versions(self) -> List[str]:
         """Get all available schema versions, sorted."""
-        versions = []
-        for path in self.schemas_dir.iterdir():
-            if path.is_dir() and path.name.startswith('v'):
-                versions.append(path.name)
-        return sorted(versions, key=lambda v: [int(s) for s in v[1:].split('.')])
+        if self._versions_cache is not None:
+            return list(self._versions_cache)
+
+        # DirEntry carries the d_type from readdir, so is_dir() needs no extra stat
+        with os.scandir(self.schemas_dir) as entries:
+            versions = [entry.name for entry in entries
+                        if entry.name.startswith('v') and entry.is_dir()]
+        self._versions_cache = sorted(versions, key=version_key)
+        return list(self._versions_cache)
 
     def get_schema_names(self, version: str) -> Set[str]:
         """Get all schema names for a given version."""
-        version_dir = self.schemas_dir / version
-        if not version_dir.exists():
+        if version in self._schema_names_cache:
+            return set(self._schema_names_cache[version])
+
+        suffix = ".schema.json"
+        try:
+            with os.scandir(self.schemas_dir / version) as entries:
+                schema_names = {entry.name[:-len(suffix)] for entry in entries
+                                if entry.name.endswith(suffix) and entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
             return set()
 
-        schema_names = set()
-        for schema_file in version_dir.glob("*.schema.json"):
-            schema_names.add(schema_file.stem.replace('.schema', ''))
-        return schema_names
+        self._schema_names_cache[version] = schema_names
+        return set(schema_names)
 
     def extract_properties(self, schema: Dict[str, Any], path: str = "") -> Dict[str, Dict[str, Any]]:
         """Extract all properties from a schema with their full paths."""
         properties = {}
-
-        if "properties" in schema:
-            for prop_name, prop_def in schema["properties"].items():
-                full_path = f"{path}.{prop_name}" if path else prop_name
-                properties[full_path] = prop_def
-
-                # Recursively extract nested properties
-                if "properties" in prop_def:
-                    nested_props = self.extract_properties(prop_def, full_path)
-                    properties.update(nested_props)
-
-                # Handle array items
-                if prop_def.get("type") == "array" and "items" in prop_def:
-                    items_def = prop_def["items"]
-                    if "properties" in items_def:
-                        nested_props = self.extract_properties(items_def, f"{full_path}[]")
-                        properties.update(nested_props)
+        # Worklist of property iterators; keeps depth-first pre-order without recursion
+        stack = [(iter(schema.get("properties", {}).items()), path)]
+
+        while stack:
+            items, parent_path = stack[-1]
+            entry = next(items, None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            prop_name, prop_def = entry
+            full_path = f"{parent_path}.{prop_name}" if parent_path else prop_name
+            properties[full_path] = prop_def
+
+            # Handle array items (visited after the nested properties below)
+            if prop_def.get("type") == "array" and "items" in prop_def:
+                items_def = prop_def["items"]
+                if "properties" in items_def:
+                    stack.append((iter(items_def["properties"].items()), f"{full_path}[]"))
+
+            # Nested properties
+            if "properties" in prop_def:
+                stack.append((iter(prop_def["properties"].items()), full_path))
 
         return properties
 
+    def get_schema_properties(self, version: str, schema_name: str,
+                              schema: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Flat property map for a loaded schema, extracted once per (version, schema_name)."""
+        key = (version, schema_name)
+        if key not in self._properties_cache:
+            self._properties_cache[key] = self.extract_properties(schema)
+        return self._properties_cache[key]
+
     def compare_schemas(self, from_schema: Dict[str, Any], to_schema: Dict[str, Any]) -> SchemaDiff:
         """Compare two schemas and return the differences."""
-        from_props = self.extract_properties(from_schema)
-        to_props = self.extract_properties(to_schema)
+        return self.compare_properties(self.extract_properties(from_schema), self.extract_properties(to_schema))
 
+    def compare_properties(self, from_props: Dict[str, Dict[str, Any]],
+                           to_props: Dict[str, Dict[str, Any]]) -> SchemaDiff:
+        """Compare two flat {path: definition} property maps and return the differences."""
         diff = SchemaDiff("", "")  # Will be set by caller
 
-        # Find added fields
-        for prop_path in to_props:
-            if prop_path not in from_props:
-                diff.added_fields[prop_path] = to_props[prop_path]
-
-        # Find removed fields
-        for prop_path in from_props:
-            if prop_path not in to_props:
-                diff.removed_fields[prop_path] = from_props[prop_path]
-
-        # Find modified fields
-        for prop_path in from_props:
-            if prop_path in to_props:
-                from_def = from_props[prop_path]
-                to_def = to_props[prop_path]
-
-                # Check type changes
-                from_type = from_def.get("type", "unknown")
-                to_type = to_def.get("type", "unknown")
-                if from_type != to_type:
-                    diff.type_changes[prop_path] = (from_type, to_type)
-
-                # Check enum changes
-                from_enum = from_def.get("enum", [])
-                to_enum = to_def.get("enum", [])
-                if from_enum != to_enum and (from_enum or to_enum):
-                    diff.enum_changes[prop_path] = (from_enum, to_enum)
-
-                # Check other modifications
-                if from_def != to_def:
-                    diff.modified_fields[prop_path] = {
-                        "from": from_def,
-                        "to": to_def
-                    }
+        from_keys = from_props.keys()
+        common_keys = from_keys & to_props.keys()
+
+        # Find added fields (iterate the dict, not the set, to keep schema order)
+        for prop_path, to_def in to_props.items():
+            if prop_path not in from_keys:
+                diff.added_fields[prop_path] = to_def
+
+        # Find removed and modified fields in a single pass
+        for prop_path, from_def in from_props.items():
+            if prop_path not in common_keys:
+                diff.removed_fields[prop_path] = from_def
+                continue
+
+            to_def = to_props[prop_path]
+
+            # Check type changes
+            from_type = from_def.get("type", "unknown")
+            to_type = to_def.get("type", "unknown")
+            type_changed = from_type != to_type
+            if type_changed:
+                diff.type_changes[prop_path] = (from_type, to_type)
+
+            # Check enum changes
+            from_enum = from_def.get("enum", [])
+            to_enum = to_def.get("enum", [])
+            enum_changed = from_enum != to_enum
+            if enum_changed and (from_enum or to_enum):
+                diff.enum_changes[prop_path] = (from_enum, to_enum)
+
+            # Check other modifications; a type or enum change already implies one
+            if type_changed or enum_changed or _definition_changed(from_def, to_def):
+                diff.modified_fields[prop_path] = {
+                    "from": from_def,
+                    "to": to_def
+                }
 
         return diff
 
     def detect_field_renames(self, diff: SchemaDiff) -> None:
         """Detect potential field renames based on type similarity."""
         # Simple heuristic: if a field was removed and another was added with the same type,
-        # it might be a rename
-        for removed_field, removed_def in diff.removed_fields.items():
-            removed_type = removed_def.get("type")
-            for added_field, added_def in diff.added_fields.items():
-                added_type = added_def.get("type")
-                if removed_type == added_type and removed_type:
-                    # Ask user or use naming similarity heuristics
-                    similarity = self.calculate_field_similarity(removed_field, added_field)
-                    if similarity > 0.6:  # Threshold for potential rename
-                        diff.renamed_fields[removed_field] = added_field
-                        logging.info(f"Detected potential rename: {removed_field} -> {added_field}")
+        # it might be a rename. Bucket added fields by type so only same-type pairs are scored.
+        # Names are lowercased once here rather than on every pairwise comparison
+        added_by_type: Dict[Any, List[Tuple[str, str]]] = defaultdict(list)
+        for added_field, added_def in diff.added_fields.items():
+            added_type = _type_key(added_def.get("type"))
+            if added_type:
+                added_by_type[added_type].append((added_field, added_field.lower()))
+
+        candidates = []
+        for removed_index, (removed_field, removed_def) in enumerate(diff.removed_fields.items()):
+            removed_lower = removed_field.lower()
+            for added_index, (added_field, added_lower) in enumerate(added_by_type.get(_type_key(removed_def.get("type")), ())):
+                # Edit distance is at least the length difference, which bounds the
+                # similarity from above; skip pairs that cannot clear the threshold
+                shorter, longer = sorted((len(removed_lower), len(added_lower)))
+                if not longer or 1 - (longer - shorter) / longer <= 0.6:
+                    continue
+
+                # Ask user or use naming similarity heuristics
+                similarity = _lowered_similarity(removed_lower, added_lower)
+                if similarity > 0.6:  # Threshold for potential rename
+                    candidates.append((-similarity, removed_index, added_index, removed_field, added_field))
+
+        # One-to-one assignment, best pairs first, so a strong match is never
+        # consumed by a weaker one (ties resolve in schema order)
+        candidates.sort()
+        renames = {}
+        used_targets = set()
+        for _, _, _, removed_field, added_field in candidates:
+            if removed_field in renames or added_field in used_targets:
+                continue
+            renames[removed_field] = added_field
+            used_targets.add(added_field)
+
+        for removed_field in diff.removed_fields:
+            if removed_field in renames:
+                diff.renamed_fields[removed_field] = renames[removed_field]
+                logging.info(f"Detected potential rename: {removed_field} -> {renames[removed_field]}")
 
     def calculate_field_similarity(self, field1: str, field2: str) -> float:
         """Calculate similarity between two field names."""
-        # Simple Levenshtein distance-based similarity
-        def levenshtein_distance(s1: str, s2: str) -> int:
-            if len(s1) < len(s2):
-                return levenshtein_distance(s2, s1)
-            if len(s2) == 0:
-                return len(s1)
-
-            previous_row = list(range(len(s2) + 1))
-            for i, c1 in enumerate(s1):
-                current_row = [i + 1]
-                for j, c2 in enumerate(s2):
-                    insertions = previous_row[j + 1] + 1
-                    deletions = current_row[j] + 1
-                    substitutions = previous_row[j] + (c1 != c2)
-                    current_row.append(min(insertions, deletions, substitutions))
-                previous_row = current_row
-
-            return previous_row[-1]
-
-        distance = levenshtein_distance(field1.lower(), field2.lower())
-        max_len = max(len(field1), len(field2))
-        return 1 - (distance / max_len) if max_len > 0 else 0
+        return _lowered_similarity(field1.lower(), field2.lower())
 
     def generate_migration_code(self, from_version: str, to_version: str,
                               schema_name: str, diff: SchemaDiff) -> str:
         """Generate the migration class code."""
         class_name = f"Migration_{from_version.replace('.', '_')}_{to_version.replace('.', '_')}_{schema_name.replace('_', '')}"
 
+        self.build_enum_maps(diff)
         upgrade_code = self.generate_upgrade_method(diff, schema_name)
         downgrade_code = self.generate_downgrade_method(diff, schema_name)
+        upgrade_copy = self.generate_data_binding(upgrade_code)
+        downgrade_copy = self.generate_data_binding(downgrade_code)
+        module_constants = self.generate_module_constants(diff)
 
         template = f'''"""
 Migration from {from_version} to {to_version} for {schema_name}
@@ -197,7 +339,7 @@ from migration import Migration, MigrationData
 
 logger = logging.getLogger(__name__)
 
-class {class_name}(Migration):
+{module_constants}class {class_name}(Migration):
     """Migration for {schema_name} from {from_version} to {to_version}."""
 
     VERSION = "{to_version}"
@@ -210,7 +352,7 @@ class {class_name}(Migration):
             logger.warning("Data is not a dictionary, returning as-is")
             return data
 
-        migrated_data = data.copy()
+        {upgrade_copy}
 
 {upgrade_code}
 
@@ -225,7 +367,7 @@ class {class_name}(Migration):
             logger.warning("Data is not a dictionary, returning as-is")
             return data
 
-        migrated_data = data.copy()
+        {downgrade_copy}
 
 {downgrade_code}
 
@@ -234,97 +376,147 @@ class {class_name}(Migration):
 '''
         return template
 
+    def generate_module_constants(self, diff: SchemaDiff) -> str:
+        """Generate module-level lookup tables so upgrade/downgrade don't rebuild them per call."""
+        self.build_enum_maps(diff)
+        tables = []
+        if diff.type_changes:
+            tables.append(("_UPGRADE_CONVERSIONS", {
+                field_path: self.generate_type_conversion(old_type, new_type)
+                for field_path, (old_type, new_type) in diff.type_changes.items()
+            }))
+            tables.append(("_DOWNGRADE_CONVERSIONS", {
+                field_path: self.generate_type_conversion(new_type, old_type)
+                for field_path, (old_type, new_type) in diff.type_changes.items()
+            }))
+        if diff.enum_changes:
+            tables.append(("_UPGRADE_ENUM_MAPPINGS", {
+                field_path: repr(diff.enum_maps[field_path]) for field_path in diff.enum_changes
+            }))
+            tables.append(("_DOWNGRADE_ENUM_MAPPINGS", {
+                field_path: repr(diff.enum_maps_reverse[field_path]) for field_path in diff.enum_changes
+            }))
+
+        code_lines = []
+        for table_name, entries in tables:
+            code_lines.append(f"{table_name} = {{")
+            code_lines.extend(f"    {field_path!r}: {value}," for field_path, value in entries.items())
+            code_lines.extend(("}", ""))
+
+        return "\n".join(code_lines) + "\n" if code_lines else ""
+
+    def generate_data_binding(self, method_code: str) -> str:
+        """Generate the statement binding migrated_data for a method body."""
+        if method_code == NO_CHANGES_CODE:
+            # Nothing is mutated, so the shallow copy of every top-level key is wasted
+            return "migrated_data = data"
+        return "migrated_data = data.copy()"
+
     def generate_upgrade_method(self, diff: SchemaDiff, schema_name: str) -> str:
         """Generate the upgrade method code."""
         code_lines = []
+        rename_targets = frozenset(diff.renamed_fields.values())
 
         # Handle field renames first
         for old_field, new_field in diff.renamed_fields.items():
-            code_lines.append(f"        # Rename field: {old_field} -> {new_field}")
-            code_lines.append(f"        if '{old_field}' in migrated_data:")
-            code_lines.append(f"            migrated_data['{new_field}'] = migrated_data.pop('{old_field}')")
-            code_lines.append("")
+            code_lines.extend((
+                f"        # Rename field: {old_field} -> {new_field}",
+                f"        if '{old_field}' in migrated_data:",
+                f"            migrated_data['{new_field}'] = migrated_data.pop('{old_field}')",
+                "",
+            ))
 
         # Handle added fields
         for field_path, field_def in diff.added_fields.items():
-            if field_path not in diff.renamed_fields.values():  # Skip if it's a rename target
-                default_value = self.get_default_value(field_def)
-                code_lines.append(f"        # Add new field: {field_path}")
-                code_lines.append(f"        if '{field_path}' not in migrated_data:")
-                code_lines.append(f"            migrated_data['{field_path}'] = {default_value}")
-                code_lines.append("")
+            if field_path not in rename_targets:  # Skip if it's a rename target
+                code_lines.extend((
+                    f"        # Add new field: {field_path}",
+                    f"        if '{field_path}' not in migrated_data:",
+                    f"            migrated_data['{field_path}'] = {self.get_default_value(field_def)}",
+                    "",
+                ))
 
         # Handle type changes
         for field_path, (old_type, new_type) in diff.type_changes.items():
-            code_lines.append(f"        # Convert {field_path} from {old_type} to {new_type}")
-            code_lines.append(f"        if '{field_path}' in migrated_data:")
-            conversion_code = self.generate_type_conversion(old_type, new_type)
-            code_lines.append(f"            migrated_data['{field_path}'] = {conversion_code}(migrated_data['{field_path}'])")
-            code_lines.append("")
+            code_lines.extend((
+                f"        # Convert {field_path} from {old_type} to {new_type}",
+                f"        if '{field_path}' in migrated_data:",
+                f"            migrated_data['{field_path}'] = _UPGRADE_CONVERSIONS['{field_path}'](migrated_data['{field_path}'])",
+                "",
+            ))
 
         # Handle enum changes
-        for field_path, (old_values, new_values) in diff.enum_changes.items():
-            code_lines.append(f"        # Update enum values for {field_path}")
-            code_lines.append(f"        if '{field_path}' in migrated_data:")
-            enum_mapping = self.generate_enum_mapping(old_values, new_values)
-            code_lines.append(f"            enum_mapping = {enum_mapping}")
-            code_lines.append(f"            migrated_data['{field_path}'] = enum_mapping.get(migrated_data['{field_path}'], migrated_data['{field_path}'])")
-            code_lines.append("")
+        for field_path in diff.enum_changes:
+            code_lines.extend((
+                f"        # Update enum values for {field_path}",
+                f"        if '{field_path}' in migrated_data:",
+                f"            migrated_data['{field_path}'] = _UPGRADE_ENUM_MAPPINGS['{field_path}'].get(migrated_data['{field_path}'], migrated_data['{field_path}'])",
+                "",
+            ))
 
         # Handle removed fields (in downgrade, we'll need to add them back)
         for field_path in diff.removed_fields:
             if field_path not in diff.renamed_fields:  # Skip if it's a rename source
-                code_lines.append(f"        # Remove deprecated field: {field_path}")
-                code_lines.append(f"        migrated_data.pop('{field_path}', None)")
-                code_lines.append("")
+                code_lines.extend((
+                    f"        # Remove deprecated field: {field_path}",
+                    f"        migrated_data.pop('{field_path}', None)",
+                    "",
+                ))
 
-        return "\n".join(code_lines) if code_lines else "        # No changes needed"
+        return "\n".join(code_lines) if code_lines else NO_CHANGES_CODE
 
     def generate_downgrade_method(self, diff: SchemaDiff, schema_name: str) -> str:
         """Generate the downgrade method code (reverse of upgrade)."""
         code_lines = []
+        rename_targets = frozenset(diff.renamed_fields.values())
 
         # Reverse field renames
         for old_field, new_field in diff.renamed_fields.items():
-            code_lines.append(f"        # Reverse rename: {new_field} -> {old_field}")
-            code_lines.append(f"        if '{new_field}' in migrated_data:")
-            code_lines.append(f"            migrated_data['{old_field}'] = migrated_data.pop('{new_field}')")
-            code_lines.append("")
+            code_lines.extend((
+                f"        # Reverse rename: {new_field} -> {old_field}",
+                f"        if '{new_field}' in migrated_data:",
+                f"            migrated_data['{old_field}'] = migrated_data.pop('{new_field}')",
+                "",
+            ))
 
         # Remove added fields
         for field_path in diff.added_fields:
-            if field_path not in diff.renamed_fields.values():
-                code_lines.append(f"        # Remove field that was added: {field_path}")
-                code_lines.append(f"        migrated_data.pop('{field_path}', None)")
-                code_lines.append("")
+            if field_path not in rename_targets:
+                code_lines.extend((
+                    f"        # Remove field that was added: {field_path}",
+                    f"        migrated_data.pop('{field_path}', None)",
+                    "",
+                ))
 
         # Reverse type changes
         for field_path, (old_type, new_type) in diff.type_changes.items():
-            code_lines.append(f"        # Convert {field_path} from {new_type} back to {old_type}")
-            code_lines.append(f"        if '{field_path}' in migrated_data:")
-            conversion_code = self.generate_type_conversion(new_type, old_type)
-            code_lines.append(f"            migrated_data['{field_path}'] = {conversion_code}(migrated_data['{field_path}'])")
-            code_lines.append("")
+            code_lines.extend((
+                f"        # Convert {field_path} from {new_type} back to {old_type}",
+                f"        if '{field_path}' in migrated_data:",
+                f"            migrated_data['{field_path}'] = _DOWNGRADE_CONVERSIONS['{field_path}'](migrated_data['{field_path}'])",
+                "",
+            ))
 
         # Reverse enum changes
-        for field_path, (old_values, new_values) in diff.enum_changes.items():
-            code_lines.append(f"        # Reverse enum values for {field_path}")
-            code_lines.append(f"        if '{field_path}' in migrated_data:")
-            enum_mapping = self.generate_enum_mapping(new_values, old_values)
-            code_lines.append(f"            enum_mapping = {enum_mapping}")
-            code_lines.append(f"            migrated_data['{field_path}'] = enum_mapping.get(migrated_data['{field_path}'], migrated_data['{field_path}'])")
-            code_lines.append("")
+        for field_path in diff.enum_changes:
+            code_lines.extend((
+                f"        # Reverse enum values for {field_path}",
+                f"        if '{field_path}' in migrated_data:",
+                f"            migrated_data['{field_path}'] = _DOWNGRADE_ENUM_MAPPINGS['{field_path}'].get(migrated_data['{field_path}'], migrated_data['{field_path}'])",
+                "",
+            ))
 
         # Add back removed fields with default values
         for field_path, field_def in diff.removed_fields.items():
             if field_path not in diff.renamed_fields:
-                default_value = self.get_default_value(field_def)
-                code_lines.append(f"        # Add back removed field: {field_path}")
-                code_lines.append(f"        if '{field_path}' not in migrated_data:")
-                code_lines.append(f"            migrated_data['{field_path}'] = {default_value}")
-                code_lines.append("")
+                code_lines.extend((
+                    f"        # Add back removed field: {field_path}",
+                    f"        if '{field_path}' not in migrated_data:",
+                    f"            migrated_data['{field_path}'] = {self.get_default_value(field_def)}",
+                    "",
+                ))
 
-        return "\n".join(code_lines) if code_lines else "        # No changes needed"
+        return "\n".join(code_lines) if code_lines else NO_CHANGES_CODE
 
     def get_default_value(self, field_def: Dict[str, Any]) -> str:
         """Get a default value for a field based on its definition."""
@@ -365,6 +557,27 @@ class {class_name}(Migration):
 
     def generate_enum_mapping(self, old_values: List[str], new_values: List[str]) -> Dict[str, str]:
         """Generate a mapping between old and new enum values."""
+        return self._assign_enum_values(old_values, new_values, self.calculate_field_similarity)
+
+    def build_enum_maps(self, diff: SchemaDiff) -> None:
+        """Compute upgrade and downgrade enum mappings for every changed enum field.
+
+        Both directions are derived from one similarity table per field, so each
+        (old, new) pair is scored once rather than once per direction.
+        """
+        for field_path, (old_values, new_values) in diff.enum_changes.items():
+            if field_path in diff.enum_maps:
+                continue
+            scores = {(old_val, new_val): self.calculate_field_similarity(old_val, new_val)
+                      for old_val in old_values for new_val in new_values}
+            diff.enum_maps[field_path] = self._assign_enum_values(
+                old_values, new_values, lambda o, n: scores[(o, n)])
+            diff.enum_maps_reverse[field_path] = self._assign_enum_values(
+                new_values, old_values, lambda n, o: scores[(o, n)])
+
+    def _assign_enum_values(self, old_values: List[str], new_values: List[str],
+                            similarity) -> Dict[str, str]:
+        """Greedily map each old value to its most similar unused new value."""
         # Simple heuristic: map by similarity
         mapping = {}
         used_new_values = set()
@@ -375,9 +588,9 @@ class {class_name}(Migration):
 
             for new_val in new_values:
                 if new_val not in used_new_values:
-                    similarity = self.calculate_field_similarity(old_val, new_val)
-                    if similarity > best_similarity:
-                        best_similarity = similarity
+                    value_similarity = similarity(old_val, new_val)
+                    if value_similarity > best_similarity:
+                        best_similarity = value_similarity
                         best_match = new_val
 
             if best_match and best_similarity > 0.5:
@@ -408,10 +621,12 @@ class {class_name}(Migration):
             diff = SchemaDiff(from_version, to_version)
             diff.structural_changes.append(f"Schema {schema_name} removed")
         else:
-            diff = self.compare_schemas(from_schema, to_schema)
+            diff = self.compare_properties(self.get_schema_properties(from_version, schema_name, from_schema),
+                                           self.get_schema_properties(to_version, schema_name, to_schema))
             diff.from_version = from_version
             diff.to_version = to_version
             self.detect_field_renames(diff)
+            self.build_enum_maps(diff)
 
         # Generate migration code
         migration_code = self.generate_migration_code(from_version, to_version, schema_name, diff)
@@ -420,23 +635,14 @@ class {class_name}(Migration):
         migration_filename = f"{from_version}_to_{to_version}_{schema_name}.py"
         migration_path = self.migrations_dir / migration_filename
 
-        with open(migration_path, 'w') as f:
-            f.write(migration_code)
+        migration_path.write_text(migration_code, encoding='utf-8')
 
         logging.info(f"Generated migration: {migration_path}")
         return True
 
     def generate_migrations_between_versions(self, from_version: str, to_version: str) -> None:
         """Generate all migration scripts between two versions."""
-        from_schemas = self.get_schema_names(from_version)
-        to_schemas = self.get_schema_names(to_version)
-        all_schemas = from_schemas | to_schemas
-
-        logging.info(f"Generating migrations from {from_version} to {to_version}")
-        logging.info(f"Schemas to process: {sorted(all_schemas)}")
-
-        for schema_name in sorted(all_schemas):
-            self.generate_migration_for_schema(from_version, to_version, schema_name)
+        self._generate_migrations([from_version, to_version])
 
     def generate_all_migrations(self) -> None:
         """Generate migration scripts for all version transitions."""
@@ -446,10 +652,46 @@ class {class_name}(Migration):
             logging.warning("Need at least 2 versions to generate migrations")
             return
 
-        for i in range(len(versions) - 1):
-            from_version = versions[i]
-            to_version = versions[i + 1]
-            self.generate_migrations_between_versions(from_version, to_version)
+        self._generate_migrations(versions)
+
+    def generate_schema_migrations(self, versions: List[str], schema_name: str) -> None:
+        """Generate one schema's migrations for each adjacent pair in versions."""
+        for from_version, to_version in zip(versions, versions[1:]):
+            if schema_name in self.get_schema_names(from_version) | self.get_schema_names(to_version):
+                self.generate_migration_for_schema(from_version, to_version, schema_name)
+
+    def _generate_migrations(self, versions: List[str]) -> None:
+        """Generate every schema's migrations for each adjacent pair in versions."""
+        if self.jobs is None or self.jobs < 2:
+            for from_version, to_version in zip(versions, versions[1:]):
+                all_schemas = self.get_schema_names(from_version) | self.get_schema_names(to_version)
+
+                logging.info(f"Generating migrations from {from_version} to {to_version}")
+                logging.info(f"Schemas to process: {sorted(all_schemas)}")
+
+                for schema_name in sorted(all_schemas):
+                    self.generate_migration_for_schema(from_version, to_version, schema_name)
+
+                # Bound memory between version pairs
+                _field_similarity.cache_clear()
+            return
+
+        # Schemas are independent, so with -j N each worker takes one schema across the
+        # whole version range; its generator's caches then carry over between pairs
+        schema_names = sorted(set().union(*(self.get_schema_names(version) for version in versions)))
+        if not schema_names:
+            logging.warning(f"No schemas found in {versions[0]} to {versions[-1]}")
+            return
+        logging.info(f"Generating migrations for {versions[0]} to {versions[-1]} with {self.jobs} workers")
+        logging.info(f"Schemas to process: {schema_names}")
+
+        worker = functools.partial(_generate_schema_migrations, str(self.schemas_dir), versions)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(self.jobs, len(schema_names))) as executor:
+            list(executor.map(worker, schema_names))
+
+def _generate_schema_migrations(schemas_dir: str, versions: List[str], schema_name: str) -> None:
+    """Process-pool worker: generate one schema's migrations across versions with its own generator."""
+    MigrationGenerator(schemas_dir, jobs=1).generate_schema_migrations(versions, schema_name)
 
 def main():
     """Main function to handle command-line arguments."""
@@ -480,10 +722,16 @@ def main():
         default='schemas',
         help="Directory containing schema versions (default: 'schemas')"
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help="Worker processes, one schema each (default: run sequentially in this process)"
+    )
 
     args = parser.parse_args()
 
-    generator = MigrationGenerator(args.schemas_dir)
+    generator = MigrationGenerator(args.schemas_dir, jobs=args.jobs)
 
     if args.all:
         generator.generate_all_migrations()
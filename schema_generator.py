@@ -13,6 +13,12 @@ from pathlib import Path
 from pydantic import BaseModel
 from prismtm.logs import get_logger
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib json encoder
+    orjson = None
+
 log = get_logger("schema_generator")
 
 # Try to import version from package __init__.py
@@ -114,8 +120,10 @@ class SchemaGenerator:
 
                 # Write schema file
                 schema_path = version_dir / schema_filename
-                with open(schema_path, "w", encoding="utf-8") as f:
-                    json.dump(schema, f, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    schema_path.write_bytes(orjson.dumps(schema, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    schema_path.write_text(json.dumps(schema, indent=2, ensure_ascii=False), encoding="utf-8")
 
                 print(f"Generated: {schema_path}")
 
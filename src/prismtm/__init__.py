@@ -5,21 +5,34 @@ This package provides tools for organizing work through a hierarchical structure
 Phase → Milestone → Block → Task → Subtask
 """
 
+import importlib
+
 from .version import VERSION, APP_SCHEMA_VERSION
-from .models import (
-    TaskStatus,
-    BugStatus,
-    BugSeverity,
-    TaskPath,
-    TaskTree,
-    ProjectBugList,
-    GlobalBugList,
-    ProjectTimeTracker,
-)
-from .data import DataCore
 
 __version__ = VERSION
 
+# The models and DataCore pull in pydantic, yaml and jsonschema; they are resolved
+# on first attribute access so light entry points (e.g. `prsm --version`) skip them.
+_LAZY_ATTRS = {
+    "TaskStatus": ".models",
+    "BugStatus": ".models",
+    "BugSeverity": ".models",
+    "TaskPath": ".models",
+    "TaskTree": ".models",
+    "ProjectBugList": ".models",
+    "GlobalBugList": ".models",
+    "ProjectTimeTracker": ".models",
+    "DataCore": ".data",
+}
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
     "VERSION",
     "APP_SCHEMA_VERSION",
@@ -0,0 +1,21 @@
+"""
+Entry point for the ``prsm`` command and ``python -m prismtm``.
+
+``prsm --version`` is answered here without importing click; every other
+invocation is handed to the click CLI.
+"""
+import sys
+
+
+def main():
+    if sys.argv[1:] == ['--version']:
+        from .version import VERSION
+        print(f"prsm, version {VERSION}")
+        return
+
+    from .cli import main as cli_main
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,76 @@ Command Line Interface for Prism Task Manager.
 """
 
 import click
+import functools
 import os
+import sys
 from pathlib import Path
 
-from prismtm.recovery import FatalError
+from prismtm.recovery import PRISMError
 from .version import VERSION
-from .data import DataCore, BackupManager
-from .models import TaskTree, ProjectBugList, GlobalBugList, ProjectTimeTracker
+
+# Data and model imports (pydantic, yaml, jsonschema) are deferred to the commands
+# that need them, keeping `prsm --version` and `prsm --help` cheap.
+
+# Status markers shared by every command's output
+_OK = "✅"
+_NO = "❌"
+_WARN = "⚠️"
+_TIP = "💡"
+
+# What the models serialize to when empty (TaskTree with blank paths,
+# ProjectTimeTracker(), ProjectBugList()). init writes these directly instead of
+# building and dumping the models; tests check they stay in sync.
+_EMPTY_YAMLS = {
+    'tasktree.yml': b"current_task_path: ''\nnav_path: ''\nphases: []\norphans: []\n",
+    'time.yml': b"sessions: []\n",
+    'bugs.yml': b"tags: []\nbugs: {}\n",
+}
+
+
+def _catch(message: str):
+    """
+    Report any error raised by a command as a one-line message instead of a
+    traceback. click's own Abort and usage errors pass through untouched.
+    """
+    def decorator(command):
+        @functools.wraps(command)
+        def wrapper(*args, **kwargs):
+            try:
+                return command(*args, **kwargs)
+            except (click.Abort, click.ClickException):
+                raise
+            except Exception as e:
+                click.echo(f"{_NO} {message}: {e}")
+        return wrapper
+    return decorator
+
+
+def _write_new_file(path, data: bytes) -> None:
+    """Create path and write data to it, failing if the file already exists."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+class _DirSnapshot:
+    """The entries of a directory, read once with a single scandir."""
+
+    __slots__ = ('names', 'exists')
+
+    def __init__(self, path):
+        try:
+            with os.scandir(path) as entries:
+                self.names = frozenset(entry.name for entry in entries)
+            self.exists = True
+        except (FileNotFoundError, NotADirectoryError):
+            self.names = frozenset()
+            self.exists = False
+
+    def has(self, name: str) -> bool:
+        return name in self.names
 
 @click.group()
 @click.version_option(version=VERSION, prog_name="prsm")
@@ -25,108 +88,125 @@ def main():
 @main.command()
 @click.option('--timetracking/--no-timetracking', default=None, help='Enable time tracking')
 @click.option('--bugtracking/--no-bugtracking', default=None, help='Enable bug tracking')
+@_catch("Error initializing project")
 def init(timetracking, bugtracking):
     """Initialize a new Prism project in the current directory."""
+    from .data.io import atomic_write, DATA_JSON
+    from .version import APP_SCHEMA_VERSION
+
     current_dir = Path.cwd()
     prsm_dir = current_dir / '.prsm'
 
-    # Check if already initialized
-    if prsm_dir.exists():
-        click.echo("❌ Project already initialized (.prsm directory exists)")
+    # Creating the .prsm directory doubles as the already-initialized check
+    try:
+        prsm_dir.mkdir(exist_ok=False)
+    except FileExistsError:
+        click.echo(f"{_NO} Project already initialized (.prsm directory exists)")
         return
 
     click.echo(f"🚀 Initializing Prism project in {current_dir}")
 
-    # Ask for optional features if not specified
-    if timetracking is None:
-        timetracking = click.confirm("📊 Enable time tracking?", default=False)
+    # Ask for optional features if not specified; an aborted prompt must not
+    # leave an empty .prsm behind
+    try:
+        if timetracking is None:
+            timetracking = click.confirm("📊 Enable time tracking?", default=False)
 
-    if bugtracking is None:
-        bugtracking = click.confirm("🐛 Enable bug tracking?", default=False)
+        if bugtracking is None:
+            bugtracking = click.confirm("🐛 Enable bug tracking?", default=False)
+    except click.Abort:
+        prsm_dir.rmdir()
+        raise
 
-    try:
-        # Create .prsm directory
-        prsm_dir.mkdir(exist_ok=True)
-        click.echo("📁 Created .prsm directory")
-
-        # Create required tasktree.yml
-        tasktree_file = prsm_dir / 'tasktree.yml'
-        empty_tasktree = TaskTree(
-            current_task_path="",
-            nav_path=""
-        )
-        tasktree_file.write_text(empty_tasktree.to_yaml())
-        click.echo("📋 Created tasktree.yml")
+    click.echo("📁 Created .prsm directory")
 
-        # Create optional files based on user choice
-        if timetracking:
-            time_file = prsm_dir / 'time.yml'
-            empty_time = ProjectTimeTracker()
-            time_file.write_text(empty_time.to_yaml())
-            click.echo("⏱️  Created time.yml")
+    # Create required tasktree.yml
+    _write_new_file(prsm_dir / 'tasktree.yml', _EMPTY_YAMLS['tasktree.yml'])
+    click.echo("📋 Created tasktree.yml")
 
-        if bugtracking:
-            bugs_file = prsm_dir / 'bugs.yml'
-            empty_bugs = ProjectBugList()
-            bugs_file.write_text(empty_bugs.to_yaml())
-            click.echo("🐛 Created bugs.yml")
+    # Create optional files based on user choice
+    if timetracking:
+        _write_new_file(prsm_dir / 'time.yml', _EMPTY_YAMLS['time.yml'])
+        click.echo("⏱️  Created time.yml")
 
-        click.echo("✅ Project initialized successfully!")
-        click.echo("💡 Use 'prsm status' to verify your project setup")
+    if bugtracking:
+        _write_new_file(prsm_dir / 'bugs.yml', _EMPTY_YAMLS['bugs.yml'])
+        click.echo("🐛 Created bugs.yml")
 
-    except Exception as e:
-        click.echo(f"❌ Error initializing project: {e}")
+    # Record the schema version so validation can skip probing every version
+    atomic_write(DATA_JSON, prsm_dir / 'meta.json', {"schema_version": APP_SCHEMA_VERSION})
+    click.echo("🏷️  Created meta.json")
+
+    click.echo(f"{_OK} Project initialized successfully!")
+    click.echo(f"{_TIP} Use 'prsm status' to verify your project setup")
 
 
 @main.command()
 def status():
     """Show the current project status and file information."""
-    click.echo("🔧 Prism Task Manager")
-    click.echo(f"📦 Version: {VERSION}")
-    click.echo("📋 Current Phase: Pre-Alpha")
-    click.echo("")
-    data = DataCore()
-
-    # Check if we're in a Prism project
-    prsm_dir = Path.cwd() / '.prsm'
-    if not prsm_dir.exists():
-        click.echo("❌ Not in a Prism project directory")
-        click.echo("💡 Run 'prsm init' to initialize a project")
+    # Check if we're in a Prism project before doing anything else; one
+    # directory read answers that and which data files exist
+    current_dir = Path.cwd()
+    prsm_dir = current_dir / '.prsm'
+    snap = _DirSnapshot(prsm_dir)
+    if not snap.exists:
+        # Scripts polling for a project only need the exit status
+        if not sys.stdout.isatty():
+            sys.exit(1)
+        click.echo(f"{_NO} Not in a Prism project directory\n"
+                   f"{_TIP} Run 'prsm init' to initialize a project")
         return
 
-    click.echo("📁 Project Status:")
-    click.echo(f"   📍 Location: {Path.cwd()}")
+    from .data import DataCore
+    data = DataCore()
 
+    # Lines are collected and written with one echo per section
+    out = [
+        "🔧 Prism Task Manager",
+        f"📦 Version: {VERSION}",
+        "📋 Current Phase: Pre-Alpha",
+        "",
+        "📁 Project Status:",
+    ]
+    out.append(f"   📍 Location: {current_dir}")
+    if snap.has('tasktree.yml'):
+        out.append(f"   {_OK} tasktree.yml (required)")
+    else:
+        out.append(f"   {_NO} tasktree.yml (required - missing!)")
+    for optional_file in ('time.yml', 'bugs.yml'):
+        if snap.has(optional_file):
+            out.append(f"   {_OK} {optional_file} (optional)")
+    click.echo("\n".join(out))
+
+    # Invalid data and data needing migration are both reported, not raised
     try:
         data.validate_context()
-    except FatalError as e:
+    except PRISMError as e:
         click.echo(f"Validation error: {e}")
 
     # Try to load and validate files using DataCore
     try:
-        with data.load_context() as context:
-            click.echo("")
-            click.echo("🔍 File Validation:")
-
-            # Check tasktree
-            if hasattr(context.project, 'tasktree'):
-                phases = len(context.project.tasktree.phases) if context.project.tasktree.phases else 0
-                click.echo(f"   📋 TaskTree: {phases} phases")
-
-            # Check time tracking
-            if hasattr(context.project, 'time'):
-                sessions = len(context.project.time.sessions) if context.project.time.sessions else 0
-                click.echo(f"   ⏱️  Time Tracking: {sessions} sessions logged")
-
-            # Check bug tracking
-            if hasattr(context.project, 'bugs'):
-                bugs = len(context.project.bugs.bugs) if context.project.bugs.bugs else 0
-                click.echo(f"   🐛 Bug Tracking: {bugs} bugs tracked")
-
-            click.echo("✅ All files loaded successfully!")
+        with data.load_context(prsm_dir) as context:
+            out = ["", "🔍 File Validation:"]
+
+            # Summarize each loaded file; models for missing files are None
+            project = context.project
+            for model_name, items_name, label, unit in (
+                ('tasktree', 'phases', "📋 TaskTree", "phases"),
+                ('time', 'sessions', "⏱️  Time Tracking", "sessions logged"),
+                ('bugs', 'bugs', "🐛 Bug Tracking", "bugs tracked"),
+            ):
+                model = getattr(project, model_name, None)
+                if model is None:
+                    continue
+                items = getattr(model, items_name, None) or ()
+                out.append(f"   {label}: {len(items)} {unit}")
+
+            out.append(f"{_OK} All files loaded successfully!")
+            click.echo("\n".join(out))
 
     except Exception as e:
-        click.echo(f"⚠️  Warning: Error loading project files: {e}")
+        click.echo(f"{_WARN}  Warning: Error loading project files: {e}")
 
 
 @main.group()
@@ -161,83 +241,87 @@ def backup():
 @click.option('--name', help='Custom name for the backup')
 @click.option('--user', '-u', 'scope', flag_value='user', help='Backup user scope data')
 @click.option('--project', '-p', 'scope', flag_value='project', default=True, help='Backup project scope data (default)')
+@_catch("Error creating backup")
 def create(name, scope):
     """Create a backup of project data."""
-    try:
-        backup_manager = BackupManager()
-        if scope == "project":
-            backup_path = backup_manager.backup_project(name)
-            click.echo(f"✅ Backup created: {backup_path}")
-        elif scope == "user":
-            backup_path = backup_manager.backup_user(name)
-            click.echo(f"✅ Backup created: {backup_path}")
-
-    except Exception as e:
-        click.echo(f"❌ Error creating backup: {e}")
-
-@backup.command()
+    from .data import BackupManager
+    backup_manager = BackupManager()
+    if scope == "project":
+        backup_path = backup_manager.backup_project(name)
+        click.echo(f"{_OK} Backup created: {backup_path}")
+    elif scope == "user":
+        backup_path = backup_manager.backup_user(name)
+        click.echo(f"{_OK} Backup created: {backup_path}")
+
+@backup.command(name='list')
 @click.option('--user', '-u', 'scope', flag_value='user', help='Backup user scope data')
 @click.option('--project', '-p', 'scope', flag_value='project', default=True, help='Backup project scope data (default)')
-def list(scope):
+@_catch("Error listing backups")
+def list_backups(scope):
     """List all available backups."""
-    try:
-        backup_manager = BackupManager()
-        backups = backup_manager.list_project_backups() if scope == "project" else backup_manager.list_user_backups()
-
-        if not backups:
-            click.echo("📭 No backups found")
-            return
+    from .data import BackupManager
+    backup_manager = BackupManager()
+    backups = backup_manager.list_project_backups() if scope == "project" else backup_manager.list_user_backups()
 
-        click.echo("📦 Available backups:")
-        click.echo("")
-
-        for backup in backups:
-            click.echo(f"🗂️  {backup['backup_folder']}")
-            click.echo(f"   📅 Created: {backup['created_at']}")
-            if backup['backup_id']:
-                click.echo(f"   🏷️  Name: {backup['backup_id']}")
-            click.echo(f"   📋 Project files: {backup['files_count']}")
-            click.echo("")
+    if not backups:
+        click.echo("📭 No backups found")
+        return
 
-    except Exception as e:
-        click.echo(f"❌ Error listing backups: {e}")
+    files_label = "User files" if scope == "user" else "Project files"
+    out = ["📦 Available backups:\n"]
+    for backup in backups:
+        custom_name = backup.get('custom_name')
+        out.append(
+            f"🗂️  {backup['backup_folder']}\n"
+            f"   📅 Created: {backup['created_at']}\n"
+            + (f"   🏷️  Name: {custom_name}\n" if custom_name else "")
+            + f"   📋 {files_label}: {backup.get('files_count', 0)}\n"
+        )
+    click.echo("\n".join(out))
 
 @backup.command()
 @click.argument('backup_folder')
 @click.option('--user', '-u', 'scope', flag_value='user', help='Backup user scope data')
 @click.option('--project', '-p', 'scope', flag_value='project', default=True, help='Backup project scope data (default)')
-@click.confirmation_option(prompt='Are you sure you want to restore from backup?')
-def restore(backup_folder, scope, files):
+@click.option('--files', help='Comma-separated list of files to restore (default: all)')
+@click.option('--yes', is_flag=True, help='Confirm the action without prompting.')
+@_catch("Error restoring backup")
+def restore(backup_folder, scope, files, yes):
     """Restore from a backup."""
-    try:
-        backup_manager = BackupManager()
-        success = backup_manager.restore_user_backup(backup_folder) if scope =="user" else backup_manager.restore_project_backup(backup_folder)
-
-        if success:
-            click.echo("✅ Backup restored successfully")
-            click.echo("💡 A backup of your previous state was created as 'pre_restore_backup'")
-        else:
-            click.echo("❌ Failed to restore backup")
-
-    except Exception as e:
-        click.echo(f"❌ Error restoring backup: {e}")
+    if not yes:
+        click.confirm('Are you sure you want to restore from backup?', abort=True)
+    from .data import BackupManager
+    files_to_restore = tuple(map(str.strip, files.split(','))) if files else None
+    backup_manager = BackupManager()
+    if scope == "user":
+        success = backup_manager.restore_user_backup(backup_folder, files=files_to_restore)
+    else:
+        success = backup_manager.restore_project_backup(backup_folder, files=files_to_restore)
+
+    if success:
+        click.echo(f"{_OK} Backup restored successfully")
+        click.echo(f"{_TIP} A backup of your previous state was created as 'pre_restore_backup'")
+    else:
+        click.echo(f"{_NO} Failed to restore backup")
 
 @backup.command()
 @click.option('--keep', default=10, help='Number of backups to keep (default: 10)')
-@click.confirmation_option(prompt='Are you sure you want to cleanup old backups?')
-def cleanup(keep):
+@click.option('--user', '-u', 'scope', flag_value='user', help='Cleanup user scope backups')
+@click.option('--project', '-p', 'scope', flag_value='project', default=True, help='Cleanup project scope backups (default)')
+@click.option('--yes', is_flag=True, help='Confirm the action without prompting.')
+@_catch("Error cleaning up backups")
+def cleanup(keep, scope, yes):
     """Remove old backups, keeping only the most recent ones."""
-    try:
-        backup_manager = DataCore.get_backup_manager()
-        removed_count = backup_manager.cleanup_old_backups(keep)
-
-        if removed_count > 0:
-            click.echo(f"✅ Removed {removed_count} old backup(s)")
-        else:
-            click.echo("📦 No backups needed to be removed")
-
-    except Exception as e:
-        click.echo(f"❌ Error cleaning up backups: {e}")
+    if not yes:
+        click.confirm('Are you sure you want to cleanup old backups?', abort=True)
+    from .data import BackupManager
+    backup_manager = BackupManager()
+    removed_count = backup_manager.cleanup_old_backups(scope, keep)
+
+    if removed_count > 0:
+        click.echo(f"{_OK} Removed {removed_count} old backup(s)")
+    else:
+        click.echo("📦 No backups needed to be removed")
 
 if __name__ == "__main__":
     main()
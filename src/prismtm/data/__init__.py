@@ -2,11 +2,24 @@
 Data management submodule providing core functionality for data operations.
 """
 
-# Import the main concierge class
-from .core import DataCore
-from .backup import BackupManager
-# Import the engine classes for direct access if needed
-from .migrate import MigrationEngine
+import importlib
+
+# Each entry point is imported on first access: backup commands need only the
+# backup manager, not DataCore's models (pydantic), and only migration commands
+# need the migration engine.
+_LAZY_ATTRS = {
+    'DataCore': '.core',
+    'BackupManager': '.backup',
+    'MigrationEngine': '.migrate',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 # Define what gets imported with `from data import *`
 __all__ = [
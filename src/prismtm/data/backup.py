@@ -1,12 +1,27 @@
+import os
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Collection
 from .io import atomic_write, DATA_JSON, load_json_file
 from prismtm.logs import get_logger
 
 log = get_logger('data.backup')
 
+# Sort key for backup metadata; listings fill in a missing created_at
+_created_at = itemgetter("created_at")
+
+def _entries(directory: Path) -> list:
+    """
+    List a directory in one os.scandir pass.
+
+    DirEntry.is_file()/is_dir() answer from the listing itself, so callers
+    don't pay a stat per entry as with Path.iterdir().
+    """
+    with os.scandir(directory) as entries:
+        return list(entries)
+
 class BackupManager:
     PROJECT_BACKUP_DIR = Path(".prsm") / "backups"
     PRISM_PROJECT_DIR = Path(".prsm")
@@ -57,16 +72,16 @@ class BackupManager:
                 # Create parent directories if needed
                 dest_file.parent.mkdir(parents=True, exist_ok=True)
 
-                # Copy file with metadata
-                shutil.copy2(item, dest_file)
+                # Plain byte copy; the kernel does it in one call where it can
+                shutil.copyfile(item, dest_file)
                 copied_files.append(str(relative_path))
 
         return copied_files
 
     def backup_project(self, backup_name: Optional[str] = None) -> Path:
         """Create a backup of the current project's .prsm directory"""
-        if not BackupManager.PROJECT_BACKUP_DIR.exists():
-            raise FileNotFoundError(f"Project source directory {BackupManager.PROJECT_BACKUP_DIR} does not exist")
+        if not BackupManager.PRISM_PROJECT_DIR.exists():
+            raise FileNotFoundError(f"Project source directory {BackupManager.PRISM_PROJECT_DIR} does not exist")
 
         # Generate backup ID and create backup directory
         backup_id = self._generate_backup_id(backup_name)
@@ -76,19 +91,19 @@ class BackupManager:
         source_files = []
         backup_dir.mkdir(parents=True, exist_ok=True)
 
-        for item in BackupManager.PRISM_PROJECT_DIR.iterdir():
+        for item in _entries(BackupManager.PRISM_PROJECT_DIR):
             if item.name == "backups":  # Don't backup the backups directory
                 continue
             elif item.is_file():
-                shutil.copy2(item, backup_dir / item.name)
+                shutil.copyfile(item.path, backup_dir / item.name)
                 source_files.append(item.name)
             elif item.is_dir():
-                copied_files = self._copy_directory_contents(item, backup_dir / item.name)
+                copied_files = self._copy_directory_contents(Path(item.path), backup_dir / item.name)
                 source_files.extend([f"{item.name}/{f}" for f in copied_files])
 
         # Create metadata file
         metadata = self._create_backup_metadata(
-            backup_id, "project", BackupManager.PROJECT_BACKUP_DIR, source_files, backup_name
+            backup_id, "project", BackupManager.PRISM_PROJECT_DIR, source_files, backup_name
         )
 
         metadata_file = backup_dir / "backups.json"
@@ -98,8 +113,8 @@ class BackupManager:
 
     def backup_user(self, backup_name: Optional[str] = None) -> Path:
         """Create a backup of the user's prismtm directory"""
-        if not BackupManager.USER_BACKUP_DIR.exists():
-            raise FileNotFoundError(f"User source directory {BackupManager.USER_BACKUP_DIR} does not exist")
+        if not BackupManager.PRISM_USER_DIR.exists():
+            raise FileNotFoundError(f"User source directory {BackupManager.PRISM_USER_DIR} does not exist")
 
         # Generate backup ID and create backup directory
         backup_id = self._generate_backup_id(backup_name)
@@ -108,19 +123,19 @@ class BackupManager:
         # Copy all files from user directory (excluding the backups directory)
         copied_files = []
 
-        for item in BackupManager.PRISM_USER_DIR.iterdir():
+        for item in _entries(BackupManager.PRISM_USER_DIR):
             if item.name != "backups":  # Don't backup the backups directory
                 if item.is_file():
                     backup_dir.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(item, backup_dir / item.name)
+                    shutil.copyfile(item.path, backup_dir / item.name)
                     copied_files.append(item.name)
                 elif item.is_dir():
-                    files_in_dir = self._copy_directory_contents(item, backup_dir / item.name)
+                    files_in_dir = self._copy_directory_contents(Path(item.path), backup_dir / item.name)
                     copied_files.extend([f"{item.name}/{f}" for f in files_in_dir])
 
         # Create metadata file
         metadata = self._create_backup_metadata(
-            backup_id, "user", BackupManager.USER_BACKUP_DIR, copied_files, backup_name
+            backup_id, "user", BackupManager.PRISM_USER_DIR, copied_files, backup_name
         )
 
         metadata_file = backup_dir / "backups.json"
@@ -128,133 +143,124 @@ class BackupManager:
 
         return backup_dir
 
-    def list_project_backups(self) -> List[Dict[str, Any]]:
-        """List all available project backups"""
+    def _list_backups(self, backup_root: Path, backup_type: str) -> List[Dict[str, Any]]:
+        """List the backups under backup_root, newest first"""
         backups = []
 
-        if not self.PROJECT_BACKUP_DIR.exists():
+        try:
+            backup_dirs = [Path(entry.path) for entry in _entries(backup_root) if entry.is_dir()]
+        except FileNotFoundError:
             return backups
 
-        for backup_dir in self.PROJECT_BACKUP_DIR.iterdir():
-            if backup_dir.is_dir():
-                metadata_file = backup_dir / "backups.json"
-                if metadata_file.exists():
-                    try:
-                        metadata = load_json_file(metadata_file)
-                    except Exception:
-                        # If metadata is corrupted, create basic info from directory
-                        metadata = {
-                            "backup_id": backup_dir.name,
-                            "backup_type": "project",
-                            "created_at": "unknown",
-                            "files_count": len(list(backup_dir.rglob("*"))),
-                            "status": "metadata_corrupted"
-                        }
-                    if metadata != None:
-                        metadata['backup_folder'] = backup_dir
-                        backups.append(metadata)
+        for backup_dir in backup_dirs:
+            try:
+                # None when there is no metadata file, i.e. not a backup
+                metadata = load_json_file(backup_dir / "backups.json")
+            except Exception:
+                # If metadata is corrupted, create basic info from directory
+                metadata = {
+                    "backup_id": backup_dir.name,
+                    "backup_type": backup_type,
+                    "created_at": "unknown",
+                    "files_count": len(list(backup_dir.rglob("*"))),
+                    "status": "metadata_corrupted"
+                }
+            if metadata != None:
+                metadata['backup_folder'] = backup_dir
+                metadata.setdefault("created_at", "")
+                backups.append(metadata)
 
         # Sort by creation time (newest first)
-        backups.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+        backups.sort(key=_created_at, reverse=True)
         return backups
 
+    def list_project_backups(self) -> List[Dict[str, Any]]:
+        """List all available project backups"""
+        return self._list_backups(self.PROJECT_BACKUP_DIR, "project")
+
     def list_user_backups(self) -> List[Dict[str, Any]]:
         """List all available user backups"""
-        backups = []
+        return self._list_backups(self.USER_BACKUP_DIR, "user")
 
-        if not self.USER_BACKUP_DIR.exists():
-            return backups
-
-        for backup_dir in self.USER_BACKUP_DIR.iterdir():
-            if backup_dir.is_dir():
-                metadata_file = backup_dir / "backups.json"
-                if metadata_file.exists():
-                    try:
-                        metadata = load_json_file(metadata_file)
-                        backups.append(metadata)
-                    except Exception:
-                        # If metadata is corrupted, create basic info from directory
-                        backups.append({
-                            "backup_id": backup_dir.name,
-                            "backup_type": "user",
-                            "created_at": "unknown",
-                            "files_count": len(list(backup_dir.rglob("*"))),
-                            "status": "metadata_corrupted"
-                        })
-
-        # Sort by creation time (newest first)
-        backups.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return backups
-
-    def restore_project_backup(self, backup_id: str, create_safety_backup: bool = True) -> bool:
-        """Restore a project backup"""
+    def restore_project_backup(self, backup_id: str, create_safety_backup: bool = True,
+                               files: Optional[Collection[str]] = None) -> bool:
+        """Restore a project backup, or only the named top-level files if given"""
         backup_dir = self.PROJECT_BACKUP_DIR / backup_id
 
         if not backup_dir.exists():
             raise FileNotFoundError(f"Backup {backup_id} not found")
 
         # Create safety backup before restoration
-        if create_safety_backup and BackupManager.PROJECT_BACKUP_DIR.exists():
+        if create_safety_backup and BackupManager.PRISM_PROJECT_DIR.exists():
             safety_backup_name = f"pre_restore_{backup_id}"
             self.backup_project(safety_backup_name)
 
         # Remove existing files (except backups directory)
-        if BackupManager.PROJECT_BACKUP_DIR.exists():
-            for item in BackupManager.PROJECT_BACKUP_DIR.iterdir():
+        if BackupManager.PRISM_PROJECT_DIR.exists():
+            for item in _entries(BackupManager.PRISM_PROJECT_DIR):
                 if item.name == "backups":
                     continue
+                if files is not None and item.name not in files:
+                    continue
                 if item.is_file():
-                    item.unlink()
+                    os.unlink(item.path)
                 elif item.is_dir():
-                    shutil.rmtree(item)
+                    shutil.rmtree(item.path)
         else:
-            BackupManager.PROJECT_BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+            BackupManager.PRISM_PROJECT_DIR.mkdir(parents=True, exist_ok=True)
 
         # Restore files from backup
-        for item in backup_dir.iterdir():
+        for item in _entries(backup_dir):
             if item.name == "backups.json":
                 continue
-            dest_path = BackupManager.PROJECT_BACKUP_DIR / item.name
+            if files is not None and item.name not in files:
+                continue
+            dest_path = BackupManager.PRISM_PROJECT_DIR / item.name
             if item.is_file():
-                shutil.copy2(item, dest_path)
+                shutil.copyfile(item.path, dest_path)
             elif item.is_dir():
-                shutil.copytree(item, dest_path)
+                shutil.copytree(item.path, dest_path, copy_function=shutil.copyfile)
 
         return True
 
-    def restore_user_backup(self, backup_id: str, create_safety_backup: bool = True) -> bool:
-        """Restore a user backup"""
+    def restore_user_backup(self, backup_id: str, create_safety_backup: bool = True,
+                            files: Optional[Collection[str]] = None) -> bool:
+        """Restore a user backup, or only the named top-level files if given"""
         backup_dir = self.USER_BACKUP_DIR / backup_id
 
         if not backup_dir.exists():
             raise FileNotFoundError(f"Backup {backup_id} not found")
 
         # Create safety backup before restoration
-        if create_safety_backup and BackupManager.USER_BACKUP_DIR.exists():
+        if create_safety_backup and BackupManager.PRISM_USER_DIR.exists():
             safety_backup_name = f"pre_restore_{backup_id}"
             self.backup_user(safety_backup_name)
 
         # Remove existing files (except backups directory)
         if BackupManager.PRISM_USER_DIR.exists():
-            for item in BackupManager.USER_BACKUP_DIR.iterdir():
+            for item in _entries(BackupManager.PRISM_USER_DIR):
                 if item.name in ["backups", "logs"]:
                     continue
+                if files is not None and item.name not in files:
+                    continue
                 if item.is_file():
-                    item.unlink()
+                    os.unlink(item.path)
                 elif item.is_dir():
-                    shutil.rmtree(item)
+                    shutil.rmtree(item.path)
         else:
-            BackupManager.USER_BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+            BackupManager.PRISM_USER_DIR.mkdir(parents=True, exist_ok=True)
 
         # Restore files from backup
-        for item in backup_dir.iterdir():
-            if item.name in ["backups", "logs"]:
+        for item in _entries(backup_dir):
+            if item.name in ["backups", "logs", "backups.json"]:
+                continue
+            if files is not None and item.name not in files:
                 continue
-            dest_path = BackupManager.USER_BACKUP_DIR / item.name
+            dest_path = BackupManager.PRISM_USER_DIR / item.name
             if item.is_file():
-                shutil.copy2(item, dest_path)
+                shutil.copyfile(item.path, dest_path)
             elif item.is_dir():
-                shutil.copytree(item, dest_path)
+                shutil.copytree(item.path, dest_path, copy_function=shutil.copyfile)
 
         return True
 
@@ -281,8 +287,7 @@ class BackupManager:
         else:
             raise ValueError("backup_type must be 'project' or 'user'")
 
-        # Sort by creation time (newest first) and remove excess
-        backups.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+        # Listings are already sorted newest first; remove the excess
         deleted_count = 0
 
         for backup in backups[keep_count:]:
@@ -5,58 +5,93 @@ This module provides the main interface for validating project and user data fil
 checking schema versions, coordinating migrations, and handling backups.
 """
 from prismtm.recovery import FatalError, MigrationNeededError
-from .io import atomic_write, load_model, DATA_YAML
+from .io import atomic_write_all, load_model, DATA_YAML
 from pathlib import Path
-from typing import Union
-from .validate import find_schema_versions, validate_scope_schema, USER_SCOPE, PROJECT_SCOPE
+from typing import Union, Dict, List, Tuple
+from .validate import find_scope_version, check_scope_schema, USER_SCOPE, PROJECT_SCOPE
 from prismtm.version import APP_SCHEMA_VERSION
 from prismtm.models import TaskTree, ProjectBugList, GlobalBugList, ProjectTimeTracker, BaseYAMLModel
 from prismtm.logs import get_logger
 
-try:
-    from importlib.resources import files
-except ImportError:
-    # Python < 3.9 fallback
-    from importlib_resources import files
-
 log = get_logger("data")
 
-class UserScope:
-    """Provides access to model files within a scope (project or user)."""
-
-    def __init__(self, basepath : Path):
-        self.basepath = basepath
-        self.bugs : Union[BaseYAMLModel, None] = load_model(GlobalBugList, basepath / "bugs.yml")
-        if self.bugs == None:
-            self.bugs = GlobalBugList()
+class _ModelScope:
+    """
+    Base for scopes whose models are loaded from YAML files on first access.
 
-    def save_all(self):
-        """Save all loaded models back to their files."""
-        if self.bugs != None:
-            atomic_write(DATA_YAML, self.basepath / "bugs.yml", self.bugs.model_dump())
+    Subclasses list their models in _MODEL_FILES as
+    attribute -> (model class, file name, default factory or None), and set
+    _DURABLE to False if saves may skip the directory fsync.
+    """
 
-class ProjectScope:
-    """Provides access to model files within a scope (project or user)."""
+    _MODEL_FILES: Dict[str, tuple] = {}
+    _DURABLE = True
 
     def __init__(self, basepath : Path):
         self.basepath = basepath
-        self.tasktree = load_model(TaskTree, basepath / "tasktree.yml")
-        self.bugs = load_model(ProjectBugList, basepath / "bugs.yml")
-        self.time = load_model(ProjectTimeTracker, basepath / "time.yml")
+        self._file_paths = {name: basepath / file_name for name, (_, file_name, _) in self._MODEL_FILES.items()}
+        # Data each file is known to hold on disk, so unchanged models aren't rewritten
+        self._saved: Dict[Path, dict] = {}
+
+    def __getattr__(self, name):
+        # Only reached until the model is loaded; after that the instance
+        # attribute answers directly
+        try:
+            model_type, _, default = self._MODEL_FILES[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+
+        file_path = self._file_paths[name]
+        model = load_model(model_type, file_path)
+        if model is not None:
+            self._saved[file_path] = model.to_dict()
+        elif default is not None:
+            model = default()
+        setattr(self, name, model)
+        return model
+
+    def pending_writes(self) -> List[Tuple[Path, dict]]:
+        """Return (file path, data) pairs for every loaded model changed since it was loaded or saved."""
+        writes = []
+        for name, file_path in self._file_paths.items():
+            model : Union[BaseYAMLModel, None] = self.__dict__.get(name)
+            if model is not None:
+                data = model.to_dict()
+                if data != self._saved.get(file_path):
+                    writes.append((file_path, data))
+        return writes
 
     def save_all(self):
-        """Save all loaded models back to their files."""
-        if self.bugs != None and self.tasktree != None and self.time != None:
-            atomic_write(DATA_YAML, self.basepath / "bugs.yml", self.bugs.model_dump())
-            atomic_write(DATA_YAML, self.basepath / "tasktree.yml", self.tasktree.model_dump())
-            atomic_write(DATA_YAML, self.basepath / "bugs.yml", self.time.model_dump())
+        """Save all changed models back to their files."""
+        writes = self.pending_writes()
+        atomic_write_all(DATA_YAML, writes, durable=self._DURABLE, incremental=True)
+        self._saved.update(writes)
+
+class UserScope(_ModelScope):
+    """Provides access to model files within the user scope."""
+
+    _MODEL_FILES = {
+        'bugs': (GlobalBugList, "bugs.yml", GlobalBugList),
+    }
+    # Data is still synced before the rename; only the directory sync is skipped,
+    # so a crash can at worst roll bugs.yml back to its previous save
+    _DURABLE = False
+
+class ProjectScope(_ModelScope):
+    """Provides access to model files within the project scope."""
+
+    _MODEL_FILES = {
+        'tasktree': (TaskTree, "tasktree.yml", None),
+        'bugs': (ProjectBugList, "bugs.yml", None),
+        'time': (ProjectTimeTracker, "time.yml", None),
+    }
 
 class PrismContext:
     """Main context object providing access to project and user data."""
 
-    def __init__(self):
+    def __init__(self, project_dir : Path | None = None):
         self.user = UserScope(DataCore.USER_DATA_DIR)
-        self.project = ProjectScope(DataCore.PROJECT_DATA_DIR)
+        self.project = ProjectScope(project_dir if project_dir is not None else DataCore.PROJECT_DATA_DIR)
 
     def __enter__(self):
         """Context manager entry."""
@@ -67,31 +102,57 @@ class PrismContext:
         self.save_all()
 
     def save_all(self):
-        """Save all changes to both project and user files."""
-        self.user.save_all()
+        """Save all changes to both project and user files, one batch per scope."""
         self.project.save_all()
+        self.user.save_all()
 
 class DataCore:
     PROJECT_DATA_DIR = Path(".prsm")
     USER_DATA_DIR = Path.home() / ".local" / "share" / "prismtm" / "data"
     context : PrismContext | None = None
 
-    def load_context(self) -> PrismContext:
-        if DataCore.context == None:
-            DataCore.context = PrismContext()
+    def load_context(self, project_dir : Path | None = None) -> PrismContext:
+        """
+        Return the shared context, creating it on first use.
+
+        The context and the models it has loaded are reused for the rest of the
+        process; asking for a different project directory replaces it.
+
+        Args:
+            project_dir: The project's already-resolved .prsm directory, so the
+                context need not resolve it again. Defaults to PROJECT_DATA_DIR.
+        """
+        if project_dir is None:
+            project_dir = DataCore.PROJECT_DATA_DIR
+        if DataCore.context == None or DataCore.context.project.basepath != project_dir:
+            DataCore.context = PrismContext(project_dir)
 
         return DataCore.context
 
     def validate_context(self) -> bool:
-        project_version, user_version = find_schema_versions()
-        log.info(f"PROJECT: {project_version}; USER: {user_version}; APP: {APP_SCHEMA_VERSION};")
+        # A version found by backwards validation has already been checked file by file.
+        # Stop at the first scope that needs migrating rather than probing both.
+        project_version, project_validated = find_scope_version(PROJECT_SCOPE)
         if project_version != APP_SCHEMA_VERSION:
             raise MigrationNeededError("Project data and prism using inconcurrent versions, migrate data")
-        elif user_version != APP_SCHEMA_VERSION:
+        user_version, user_validated = find_scope_version(USER_SCOPE)
+        log.info(f"PROJECT: {project_version}; USER: {user_version}; APP: {APP_SCHEMA_VERSION};")
+        if user_version != APP_SCHEMA_VERSION:
             raise MigrationNeededError("User data and prism using inconcurrent versions, migrate data")
-        elif not validate_scope_schema(USER_SCOPE, user_version):
-            raise FatalError("user scope schema is not valid")
-        elif not validate_scope_schema(PROJECT_SCOPE, project_version):
-            raise FatalError("project scope schema is not valid")
+
+        for scope, name, version, validated in ((USER_SCOPE, "user", user_version, user_validated),
+                                                (PROJECT_SCOPE, "project", project_version, project_validated)):
+            if validated:
+                continue
+            errors, warnings = check_scope_schema(scope, version)
+            for warning in warnings:
+                log.warning(warning)
+            if errors:
+                # meta.json may be stale; see which version the files really match
+                found_version, _ = find_scope_version(scope, use_meta=False)
+                if found_version != "0.0.0":
+                    raise MigrationNeededError(f"{name.capitalize()} data matches schema {found_version}, "
+                                               f"not {version} as stamped in meta.json, migrate data")
+                raise FatalError(f"{name} scope schema is not valid: " + "; ".join(errors))
 
         return True
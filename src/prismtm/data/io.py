@@ -1,15 +1,29 @@
-import tempfile, yaml, json, os
-from typing import Union, Dict, Any, Type
+import tempfile, json, os, sys
+from contextlib import contextmanager
+from typing import Union, Dict, Any, Type, Iterable, Tuple, TYPE_CHECKING
 from pathlib import Path
 from prismtm.recovery import FileOperationError, FatalError
 from prismtm.logs import get_logger
-from prismtm.models import BaseYAMLModel
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing models pulls in pydantic
+    from prismtm.models import BaseYAMLModel
 
 log = get_logger("io")
 
 DATA_YAML = 0
 DATA_JSON = 1
 
+# A temp file only needs its contents flushed before the rename; its
+# timestamps don't matter, so skip them where the platform allows. The flush is
+# never skipped: renaming an unsynced file over its target can leave a
+# zero-length file after a crash (XFS, or ext4 without auto_da_alloc)
+_sync_data = getattr(os, 'fdatasync', os.fsync)
+
+# Serialized pieces of the last YAML saved to each path by atomic_write_all,
+# for incremental saves (see fastyaml.safe_dump_cached)
+_yaml_fragments: Dict[Path, dict] = {}
+
 def _cleanup(temp_file, temp_path):
     # Always clean up temporary file first
     temp_file_path = None
@@ -22,8 +36,8 @@ def _cleanup(temp_file, temp_path):
           os.path.exists(temp_file.name)):
         temp_file_path = temp_file.name
 
-    # Clean up the temporary file if it exists and we didn't succeed
-    if temp_file_path is not None and os.path.exists(temp_file_path) and not success:
+    # Clean up the temporary file if it exists; only called once a write has failed
+    if temp_file_path is not None and os.path.exists(temp_file_path):
         try:
             os.unlink(temp_file_path)
             log.debug(f"Cleaned up temporary file: {temp_file_path}")
@@ -39,39 +53,18 @@ def _create_dirs(file_path : Path):
         log.error(error_msg)
         raise FileOperationError(error_msg) from e
 
-def atomic_write(data_type : int, file_path : Union[Path, str], data : Dict[str, Any], create_dirs : bool = False):
-    """
-    Serialize and save data to a YAML file using atomic updates.
-    """
-    file_path = Path(file_path)
-    temp_file = None
-    temp_path = None
+def _serialization_errors() -> tuple:
+    # YAML is imported on first YAML save, so JSON-only callers never load it;
+    # before then no YAMLError can have been raised
+    yaml = sys.modules.get('yaml')
+    return (yaml.YAMLError, TypeError) if yaml is not None else (TypeError,)
 
+@contextmanager
+def _save_errors(file_path : Path):
+    """Translate errors raised while saving file_path into PRISM errors."""
     try:
-        # Create directories if requested and needed
-        if create_dirs:
-            _create_dirs(file_path)
-
-        # Create temporary file in the same directory as target for atomicity
-        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', dir=file_path.parent, prefix=f".{file_path.name}.", suffix='.tmp', delete=False) as temp_file:
-            # Attempt serialization - this is where YAMLError occurs if data is bad
-            if data_type == DATA_YAML:
-                yaml.safe_dump(data, temp_file, default_flow_style=False, sort_keys=False, indent=2, allow_unicode=True)
-            elif data_type == DATA_JSON:
-                json.dump(data, temp_file, indent=2, ensure_ascii=False)
-            else:
-                raise FatalError("Unsupported Data Format")
-            temp_file.flush()
-            os.fsync(temp_file.fileno())
-            temp_path = temp_file.name
-
-        # Atomic replace - this either completely succeeds or completely fails
-        os.replace(temp_path, file_path)
-        log.debug(f"Successfully saved YAML file: {file_path}")
-        return True
-
-    except (yaml.YAMLError, TypeError) as e:
-        _cleanup(temp_file, temp_path)
+        yield
+    except _serialization_errors() as e:
         # FATAL ERROR: Data cannot be serialized
         error_msg = (f"Data serialization failed for {file_path}. "
                     f"In-memory data may be corrupt or contain non-serializable types: {e}")
@@ -79,21 +72,132 @@ def atomic_write(data_type : int, file_path : Union[Path, str], data : Dict[str,
         raise FatalError(error_msg) from e
 
     except (IOError, OSError, PermissionError) as e:
-        _cleanup(temp_file, temp_path)
         # RECOVERABLE ERROR: I/O issues
         error_msg = f"I/O error saving YAML file {file_path}: {e}"
         log.error(error_msg)
         raise FileOperationError(error_msg) from e
 
     except Exception as e:
-        _cleanup(temp_file, temp_path)
         # UNEXPECTED FATAL ERROR
         error_msg = f"Unexpected error saving YAML file {file_path}: {e}"
         log.critical(error_msg)
         raise FatalError(error_msg) from e
-    return False
 
-def load_model(model_type : Type[BaseYAMLModel], file_path : Union[Path, str]) -> Union[None, BaseYAMLModel]:
+def _write_temp(data_type : int, file_path : Path, data : Dict[str, Any], incremental : bool = False) -> str:
+    """
+    Serialize data into a synced temporary file beside file_path.
+    An incremental YAML save reuses the unchanged parts of the last one.
+
+    Returns:
+        The temporary file's path, ready to be renamed over file_path.
+    """
+    # Serialize up front - this is where YAMLError occurs if data is bad - so the
+    # file gets one write rather than one per emitted token
+    if data_type == DATA_YAML:
+        from prismtm.fastyaml import safe_dump, safe_dump_cached
+
+    if data_type == DATA_YAML and incremental:
+        content = safe_dump_cached(data, _yaml_fragments.setdefault(file_path, {}))
+    elif data_type == DATA_YAML:
+        content = safe_dump(data, encoding='utf-8')
+    elif data_type == DATA_JSON:
+        content = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        raise FatalError("Unsupported Data Format")
+
+    # Create temporary file in the same directory as target for atomicity
+    with tempfile.NamedTemporaryFile(mode='wb', dir=file_path.parent, prefix=f".{file_path.name}.", suffix='.tmp', delete=False) as temp_file:
+        try:
+            temp_file.write(content)
+            temp_file.flush()
+            _sync_data(temp_file.fileno())
+        except BaseException:
+            _cleanup(temp_file, None)
+            raise
+    return temp_file.name
+
+def _fsync_dir(dir_path : Path):
+    """Make renames within dir_path durable. Directories cannot be synced on Windows."""
+    if os.name != 'posix':
+        return
+    fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def atomic_write(data_type : int, file_path : Union[Path, str], data : Dict[str, Any], create_dirs : bool = False, durable : bool = True):
+    """
+    Serialize and save data to a YAML file using atomic updates.
+
+    The data is always synced before the rename, so the target holds either
+    the old or the new contents. With durable=True the parent directory is
+    synced too, so the rename itself survives a crash; with durable=False a
+    crash may still roll the file back to its previous contents.
+    """
+    file_path = Path(file_path)
+
+    with _save_errors(file_path):
+        # Create directories if requested and needed
+        if create_dirs:
+            _create_dirs(file_path)
+
+        temp_path = _write_temp(data_type, file_path, data)
+        try:
+            # Atomic replace - this either completely succeeds or completely fails
+            os.replace(temp_path, file_path)
+        except BaseException:
+            _cleanup(None, temp_path)
+            raise
+
+        if durable:
+            _fsync_dir(file_path.parent)
+
+    log.debug(f"Successfully saved YAML file: {file_path}")
+    return True
+
+def atomic_write_all(data_type : int, entries : Iterable[Tuple[Union[Path, str], Dict[str, Any]]], durable : bool = True, incremental : bool = False):
+    """
+    Atomically save several files, syncing each parent directory once.
+
+    Every file is written and synced to a temporary file before any target is
+    replaced, so a serialization error leaves all of them untouched. The
+    renames are then made durable with one fsync per directory instead of a
+    journal round-trip per file.
+
+    Args:
+        data_type: DATA_YAML or DATA_JSON, used for every entry.
+        entries: (file path, data) pairs.
+        durable: Whether to sync the directories after the renames; see atomic_write.
+        incremental: For files saved repeatedly in one process, re-emit only
+            the YAML for values that changed since the previous save.
+    """
+    pending = []
+    dirs = set()
+    try:
+        for file_path, data in entries:
+            file_path = Path(file_path)
+            with _save_errors(file_path):
+                pending.append((_write_temp(data_type, file_path, data, incremental), file_path))
+            dirs.add(file_path.parent)
+
+        while pending:
+            temp_path, file_path = pending[0]
+            with _save_errors(file_path):
+                os.replace(temp_path, file_path)
+            pending.pop(0)
+            log.debug(f"Successfully saved YAML file: {file_path}")
+    finally:
+        # Whatever was not renamed into place is discarded
+        for temp_path, _ in pending:
+            _cleanup(None, temp_path)
+
+    for dir_path in (dirs if durable else ()):
+        with _save_errors(dir_path):
+            _fsync_dir(dir_path)
+    return True
+
+def load_model(model_type : Type['BaseYAMLModel'], file_path : Union[Path, str]) -> Union[None, 'BaseYAMLModel']:
     """
     Load and parse a JSON file.
 
@@ -103,14 +207,13 @@ def load_model(model_type : Type[BaseYAMLModel], file_path : Union[Path, str]) -
     Returns:
         Parsed data as dict, or None if file doesn't exist or parsing fails
     """
-    file_path = Path(file_path)
-    if not file_path.exists():
-        return None
-
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'rb') as f:
             return model_type.from_yaml(f.read())
 
+    except FileNotFoundError:
+        # Checked by opening rather than a separate stat beforehand
+        return None
     except json.JSONDecodeError as e:
         # YAML syntax errors are typically fatal (corrupted file)
         raise FatalError(f"JSON syntax error in {file_path}: {e}") from e
@@ -131,13 +234,10 @@ def load_json_file(file_path : Union[Path, str]) -> Union[None, Dict]:
     Returns:
         Parsed data as dict, or None if file doesn't exist or parsing fails
     """
-    file_path = Path(file_path)
-    if not file_path.exists():
-        return None
-
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f) or {}
+        # Parsed straight from bytes; json detects the UTF encoding itself
+        with open(file_path, 'rb') as f:
+            data = json.loads(f.read()) or {}
 
             # Basic sanity check for data corruption
             if not isinstance(data, (dict, type(None))):
@@ -145,6 +245,9 @@ def load_json_file(file_path : Union[Path, str]) -> Union[None, Dict]:
 
             return data
 
+    except FileNotFoundError:
+        # Checked by opening rather than a separate stat beforehand
+        return None
     except json.JSONDecodeError as e:
         # YAML syntax errors are typically fatal (corrupted file)
         raise FatalError(f"JSON syntax error in {file_path}: {e}") from e
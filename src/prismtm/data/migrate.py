@@ -1,18 +1,22 @@
 import os
 import sys
-import yaml
 import json
 import shutil
 import argparse
 import logging
 import importlib.util
-from typing import List, Dict, Type, Optional
+from typing import List, Dict, Type, Optional, Tuple
 try:
     from importlib.resources import files
 except ImportError:
     # Python &lt; 3.9 fallback
     from importlib_resources import files
 
+from prismtm.fastyaml import load_file, safe_dump
+from prismtm.recovery import PRISMError
+from .io import atomic_write, DATA_JSON
+from prismtm.version import version_key
+
 # Import the abstract base class to check against
 from .migration import Migration, MigrationData
 
@@ -25,10 +29,14 @@ def get_schema_dir():
     try:
         # Try to use bundled schemas from installed package
         schema_files = files('prism_task_manager') / 'schemas'
+    except ImportError:
+        schema_files = None
+
+    if schema_files is not None and schema_files.is_dir():
         return str(schema_files)
-    except (ImportError, FileNotFoundError):
-        # Fallback to development path
-        return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schemas')
+
+    # Fallback to development path
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schemas')
 
 SCHEMA_DIR = get_schema_dir()
 MIGRATIONS_DIR = os.path.join(SCHEMA_DIR, 'migrations')
@@ -44,6 +52,10 @@ class MigrationEngine:
     This class discovers available schema versions and dynamically imports
     migration classes to migrate global and local project files to the latest version.
     """
+    # Sorted schema version directories; the schema tree does not change while
+    # we run, so it is scanned once per process
+    _versions_cache: Optional[Tuple[str, ...]] = None
+
     def __init__(self):
         """Initializes the engine by discovering all schema versions and migration classes."""
         self.migrations: Dict[str, Migration] = {}
@@ -53,20 +65,23 @@ class MigrationEngine:
         logging.info(f"Latest schema version: {self.latest_version}")
         self._load_migration_classes()
 
-    def _discover_versions(self) -> List[str]:
+    def _discover_versions(self) -> Tuple[str, ...]:
         """
         Scans the SCHEMA_DIR for version directories (e.g., 'v0.0.0').
-        The versions are returned as a sorted list of strings.
+        The versions are returned as a sorted tuple of strings.
         """
-        versions = []
-        if os.path.exists(SCHEMA_DIR):
-            for name in os.listdir(SCHEMA_DIR):
-                full_path = os.path.join(SCHEMA_DIR, name)
-                if os.path.isdir(full_path) and name.startswith('v'):
-                    versions.append(name)
+        cls = type(self)
+        if cls._versions_cache is None:
+            versions = []
+            if os.path.exists(SCHEMA_DIR):
+                with os.scandir(SCHEMA_DIR) as entries:
+                    versions = [entry.name for entry in entries
+                                if entry.name.startswith('v') and entry.is_dir()]
 
-        # Sort versions to ensure migrations are applied in the correct order.
-        return sorted(versions, key=lambda v: [int(s) for s in v[1:].split('.')])
+            # Sort versions to ensure migrations are applied in the correct order.
+            cls._versions_cache = tuple(sorted(versions, key=version_key))
+
+        return cls._versions_cache
 
     def _load_migration_classes(self):
         """
@@ -146,30 +161,32 @@ class MigrationEngine:
 
         return migration_path
 
-    def migrate_file(self, file_path: str, current_version: str):
+    def migrate_file(self, file_path: str, current_version: str) -> bool:
         """
         Performs the migration for a single YAML file.
 
         Args:
             file_path: The full path to the YAML file to migrate.
             current_version: The version of the file's data.
+
+        Returns:
+            False if the migration failed and the file was restored, True otherwise.
         """
         if not os.path.exists(file_path):
             logging.error(f"File not found: {file_path}")
-            return
+            return True
 
         migration_path = self.get_migration_path(current_version)
         if not migration_path:
             logging.info(f"No migration needed for {file_path} from version {current_version}.")
-            return
+            return True
 
         backup_path = f"{file_path}.bak"
         shutil.copy2(file_path, backup_path)
         logging.info(f"Created backup at {backup_path}")
 
         try:
-            with open(file_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = load_file(file_path)
 
             logging.info(f"Starting migration for {file_path}...")
             for migration_key in migration_path:
@@ -179,19 +196,38 @@ class MigrationEngine:
                 migration_instance = self.migrations[migration_key]
                 data = migration_instance.upgrade(data)
 
-            with open(file_path, 'w') as f:
-                yaml.dump(data, f, sort_keys=False, default_flow_style=False)
+            with open(file_path, 'wb') as f:
+                safe_dump(data, f, encoding='utf-8')
 
             logging.info(f"Successfully migrated {file_path} to version {self.latest_version}.")
+            return True
 
         except Exception as e:
             logging.error(f"Migration failed for {file_path}. Restoring from backup. Error: {e}")
             if os.path.exists(backup_path):
                 shutil.copy2(backup_path, file_path)
+            return False
         finally:
             if os.path.exists(backup_path):
                 os.remove(backup_path)
 
+    def _stamp_version(self, data_dir: str) -> bool:
+        """
+        Records the latest schema version in data_dir's meta.json once its files
+        are migrated, so validation checks them against the right schema.
+        """
+        if not self.available_versions:
+            # Nothing was migrated, and there is no version to record
+            return True
+
+        meta_file = os.path.join(data_dir, 'meta.json')
+        try:
+            atomic_write(DATA_JSON, meta_file, {"schema_version": self.latest_version[1:]})
+        except PRISMError as e:
+            logging.error(f"Failed to update {meta_file}: {e}")
+            return False
+        return True
+
     def migrate_project_files(self, target_version: str) -> bool:
         """Migrates all local project files in the .prsm directory."""
         logging.info("Starting local project migration...")
@@ -207,11 +243,13 @@ class MigrationEngine:
         for file_name in files_to_migrate:
             file_path = os.path.join(LOCAL_PROJECT_DIR, file_name)
             try:
-                self.migrate_file(file_path, current_version)
+                success = self.migrate_file(file_path, current_version) and success
             except Exception as e:
                 logging.error(f"Failed to migrate {file_path}: {e}")
                 success = False
 
+        if success:
+            success = self._stamp_version(LOCAL_PROJECT_DIR)
         return success
 
     def migrate_user_files(self, target_version: str) -> bool:
@@ -229,11 +267,13 @@ class MigrationEngine:
         for file_name in files_to_migrate:
             file_path = os.path.join(GLOBAL_DATA_DIR, file_name)
             try:
-                self.migrate_file(file_path, current_version)
+                success = self.migrate_file(file_path, current_version) and success
             except Exception as e:
                 logging.error(f"Failed to migrate {file_path}: {e}")
                 success = False
 
+        if success:
+            success = self._stamp_version(GLOBAL_DATA_DIR)
         return success
 
     def run_local_migration(self):
@@ -1,18 +1,28 @@
 import os
 import yaml
 import json
+import functools
 from prismtm.logs import get_logger
+from prismtm.fastyaml import load_file
 from pathlib import Path
 
-from prismtm.version import APP_SCHEMA_VERSION
-from .io import load_json_file
-from jsonschema import validate, ValidationError, SchemaError
+from prismtm.version import APP_SCHEMA_VERSION, version_key
+from prismtm.recovery import PRISMError
+from .io import load_json_file, atomic_write, DATA_JSON
 
 PROJECT_DATA_DIR = Path(".prsm")
 USER_DATA_DIR = Path.home() / ".local" / "share" / "prismtm" / "data"
 
+# Plain-string forms for os.path checks on hot paths
+_PROJECT_DATA_PATH = os.fspath(PROJECT_DATA_DIR)
+_USER_DATA_PATH = os.fspath(USER_DATA_DIR)
+
 NO_PROJECT = "No Project"
 
+# Written to a data directory once its files pass validation, so unchanged
+# files are not parsed and validated again
+VALIDATED_FILE = ".validated"
+
 PROJECT_SCOPE = 0
 USER_SCOPE = 1
 
@@ -24,6 +34,43 @@ log = get_logger("data.validate")
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 SCHEMA_ROOT_DIR = os.path.join(BASE_DIR, 'schemas')
 
+# Schemas in a source checkout can be regenerated while we run; an installed
+# copy is fixed for the life of the process and never needs re-checking.
+_SCHEMAS_IN_SOURCE_TREE = os.path.exists(os.path.join(BASE_DIR, 'pyproject.toml'))
+
+# (schema dir mtime_ns, versions newest first)
+_schema_versions_cache = None
+
+def get_schema_versions() -> tuple:
+    """
+    Lists the available schema versions, newest first.
+
+    Versions are returned without the directory's 'v' prefix (e.g. '0.1.0'),
+    matching APP_SCHEMA_VERSION and what _load_schema expects. The listing is
+    cached; in a source checkout it is re-read when the schema directory's
+    mtime changes, otherwise it is read once per process.
+
+    Returns:
+        A tuple of version strings, or an empty tuple if no schemas are found.
+        It is the cached value itself, so it is immutable rather than copied.
+    """
+    global _schema_versions_cache
+    if _schema_versions_cache is not None and not _SCHEMAS_IN_SOURCE_TREE:
+        return _schema_versions_cache[1]
+
+    try:
+        mtime = os.stat(SCHEMA_ROOT_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return ()
+
+    if _schema_versions_cache is None or _schema_versions_cache[0] != mtime:
+        with os.scandir(SCHEMA_ROOT_DIR) as entries:
+            versions = [entry.name[1:] for entry in entries
+                        if entry.name.startswith('v') and entry.is_dir()]
+        _schema_versions_cache = (mtime, tuple(sorted(versions, key=version_key, reverse=True)))
+
+    return _schema_versions_cache[1]
+
 def _load_schema(schema_version: str, schema_name: str) -> dict:
     """
     Loads a JSON schema from the file system for a specific version.
@@ -45,10 +92,40 @@ def _load_schema(schema_version: str, schema_name: str) -> dict:
         raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
     log.info(f"Loading schema from: {schema_path}")
-    with open(schema_path, 'r') as f:
-        schema = json.load(f)
+    with open(schema_path, 'rb') as f:
+        schema = json.loads(f.read())
     return schema
 
+@functools.lru_cache(maxsize=None)
+def _get_validator(schema_version: str, schema_name: str):
+    """
+    Returns a compiled validator for a schema, built once per process.
+
+    The schema is loaded and checked on first use; later calls for the same
+    (version, name) reuse the validator. Failures (e.g. FileNotFoundError) are
+    not cached.
+    """
+    # jsonschema is only imported once something is actually validated
+    from jsonschema.validators import validator_for
+
+    schema = _load_schema(schema_version, schema_name)
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+def _validate_instance(data, schema_version: str, schema_name: str) -> None:
+    """
+    Validates data against a cached schema validator.
+
+    Raises:
+        ValidationError: With the most relevant error, as jsonschema.validate does.
+    """
+    from jsonschema.exceptions import best_match
+
+    error = best_match(_get_validator(schema_version, schema_name).iter_errors(data))
+    if error is not None:
+        raise error
+
 def validate_file_schema(file_path: str, schema_version: str) -> bool:
     """
     Validates a YAML file against its corresponding schema for a given version.
@@ -70,14 +147,13 @@ def validate_file_schema(file_path: str, schema_version: str) -> bool:
     # Determine schema name from file name (e.g., 'project.yml' -> 'project.json')
     schema_name = os.path.basename(file_path).replace('.yml', '.json')
 
+    from jsonschema import ValidationError, SchemaError
     try:
-        # Load the schema and the data to be validated
-        schema = _load_schema(schema_version, schema_name)
-        with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
+        # Load the data to be validated
+        data = load_file(file_path)
 
         # Perform the validation
-        validate(instance=data, schema=schema)
+        _validate_instance(data, schema_version, schema_name)
         log.info(f"File '{file_path}' is VALID for schema version '{schema_version}'.")
         return True
 
@@ -101,6 +177,31 @@ def validate_file_schema(file_path: str, schema_version: str) -> bool:
         log.error(f"An unexpected error occurred during validation: {e}")
         return False
 
+def validate_data_schema(data, schema_version: str, schema_name: str) -> bool:
+    """
+    Validates already-parsed data against a schema, without any file I/O.
+
+    Args:
+        data: The parsed YAML content.
+        schema_version: The version of the schema to check against (e.g., '0.1.0').
+        schema_name: The schema file name (e.g., 'project_bugs.schema.json').
+
+    Returns:
+        True if the data is valid, False otherwise.
+    """
+    from jsonschema import ValidationError, SchemaError
+    try:
+        _validate_instance(data, schema_version, schema_name)
+        return True
+    except FileNotFoundError:
+        # Schema file doesn't exist for this version
+        return False
+    except (json.JSONDecodeError, ValidationError, SchemaError):
+        return False
+    except Exception as e:
+        log.debug("Unexpected error with version %s: %s", schema_version, e)
+        return False
+
 def find_schema_version(file_path: str) -> str | None:
     """
     Finds the correct schema version for a given YAML file by attempting
@@ -113,7 +214,7 @@ def find_schema_version(file_path: str) -> str | None:
         The version string of the first successful schema match, or None if no
         matching schema is found.
     """
-    schema_versions = sorted(os.listdir(SCHEMA_ROOT_DIR), reverse=True)
+    schema_versions = get_schema_versions()
     if not schema_versions:
         log.error(f"No schema versions found in '{SCHEMA_ROOT_DIR}'.")
         return None
@@ -132,29 +233,97 @@ def find_schema_version(file_path: str) -> str | None:
     log.warning(f"Could not find a valid schema version for '{file_path}'.")
     return None
 
-def find_schema_versions() -> tuple:
-    project = _get_meta_version(PROJECT_DATA_DIR / "meta.json")
-    if project == None:
-        project = _validate_schemas_backwards(PROJECT_SCOPE)
-    user = _get_meta_version(USER_DATA_DIR / "meta.json")
-    if user == None:
-        user = _validate_schemas_backwards(USER_SCOPE)
-    return (project, user)
-
-def _get_meta_version(meta_file : Path) -> str | None:
-    if not os.path.exists(meta_file):
+def _list_yaml_files(data_dir: Path) -> list | None:
+    """
+    Lists the YAML files in a data directory with a single scandir pass.
+
+    Returns:
+        The .yml files as Paths, or None if the directory does not exist.
+    """
+    try:
+        with os.scandir(data_dir) as entries:
+            return [data_dir / entry.name for entry in entries
+                    if entry.name.endswith('.yml') and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+def _file_stamps(yaml_files: list) -> dict | None:
+    """Maps each file name to [mtime_ns, size], or None if one can't be stat'ed."""
+    try:
+        return {yaml_file.name: [st.st_mtime_ns, st.st_size]
+                for yaml_file in yaml_files for st in (os.stat(yaml_file),)}
+    except OSError:
         return None
+
+def _is_validated(data_dir: Path, version: str, stamps: dict) -> bool:
+    """Whether data_dir's .validated record shows these exact files passed against version."""
+    try:
+        record = load_json_file(data_dir / VALIDATED_FILE)
+    except PRISMError:
+        return False
+    return record == {"schema_version": version, "files": stamps}
+
+def _mark_validated(data_dir: Path, version: str, stamps: dict) -> None:
+    """Records that the files in data_dir passed against version. Best effort."""
+    try:
+        atomic_write(DATA_JSON, data_dir / VALIDATED_FILE,
+                     {"schema_version": version, "files": stamps}, durable=False)
+    except PRISMError as e:
+        log.debug("Could not record validation for %s: %s", data_dir, e)
+
+def find_scope_version(scope: int, use_meta: bool = True) -> tuple:
+    """
+    Finds the schema version of a scope's data.
+
+    Args:
+        scope: Either PROJECT_SCOPE or USER_SCOPE
+        use_meta: Whether to trust the version stamped in the scope's
+            meta.json. Pass False when the data has failed validation against
+            it, to search the schemas for the version the files really match.
+
+    Returns:
+        A (version, validated) tuple. validated is True when the version was
+        found by validating every file in the scope, so callers need not
+        validate the scope against it again.
+    """
+    if use_meta:
+        data_path = _PROJECT_DATA_PATH if scope == PROJECT_SCOPE else _USER_DATA_PATH
+        version = _get_meta_version(os.path.join(data_path, "meta.json"))
+        if version != None:
+            return (version, False)
+
+    version = _validate_schemas_backwards(scope)
+    return (version, version != "0.0.0")
+
+def _get_meta_version(meta_file : str) -> str | None:
+    # A missing file reads as None; no need to stat it first
     meta_data = load_json_file(meta_file)
 
     if meta_data != None:
-        return meta_data["schema_version"]
+        return meta_data.get("schema_version")
 
     return None
 
+@functools.lru_cache(maxsize=64)
+def _load_file_cached(file_path: str, mtime_ns: int, size: int):
+    """
+    Parses a YAML file, memoized on its stat signature.
+
+    An edited file has a new mtime/size and so misses the cache. Callers must
+    not mutate the returned data.
+    """
+    return load_file(file_path)
+
+@functools.lru_cache(maxsize=256)
+def _validate_file_cached(file_path: str, mtime_ns: int, size: int, schema_version: str, schema_name: str) -> bool:
+    """validate_data_schema for a file's contents, memoized on its stat signature."""
+    return validate_data_schema(_load_file_cached(file_path, mtime_ns, size), schema_version, schema_name)
+
 def _validate_schemas_backwards(scope: int) -> str:
     """
     Find the most recent schema version that successfully validates all files
     in the given scope by checking backwards from latest to oldest versions.
+    APP_SCHEMA_VERSION is tried first and wins whenever it validates.
 
     Args:
         scope: Either PROJECT_SCOPE or USER_SCOPE
@@ -174,73 +343,92 @@ def _validate_schemas_backwards(scope: int) -> str:
         log.error(f"Invalid scope: {scope}")
         return "0.0.0"
 
-    if not data_dir.exists():
+    # Find all YAML files in the data directory (one directory read, no per-file stat)
+    yaml_files = _list_yaml_files(data_dir)
+    if yaml_files is None:
         log.warning(f"Data directory does not exist: {data_dir}")
         return "0.0.0"
 
     # Get all schema versions sorted from latest to oldest
-    schema_versions = sorted(os.listdir(SCHEMA_ROOT_DIR), reverse=True)
+    schema_versions = get_schema_versions()
     if not schema_versions:
         log.error(f"No schema versions found in '{SCHEMA_ROOT_DIR}'.")
         return "0.0.0"
 
-    # Find all YAML files in the data directory
-    yaml_files = list(data_dir.glob("*.yml"))
     if not yaml_files:
         log.warning(f"No YAML files found in {data_dir}")
         return "0.0.0"
 
-    log.info(f"Searching for compatible schema version for scope {scope} with {len(yaml_files)} files...")
+    log.info("Searching for compatible schema version for scope %s with %d files...", scope, len(yaml_files))
 
-    # Try each schema version from latest to oldest
-    for version in schema_versions:
-        all_valid = True
-
-        # Validate each file against this schema version
-        for yaml_file in yaml_files:
-            # Convert filename to schema name: filename.yml -> scope_filename.schema.json
-            base_name = yaml_file.stem  # gets 'bugs' from 'bugs.yml'
-            schema_name = f"{scope_prefix}_{base_name}.schema.json"
-
-            try:
-                schema = _load_schema(version, schema_name)
-                with open(yaml_file, 'r') as f:
-                    data = yaml.safe_load(f)
-
-                # Perform validation
-                validate(instance=data, schema=schema)
-
-            except FileNotFoundError:
-                # Schema file doesn't exist for this version, try next version
-                all_valid = False
-                break
-            except (json.JSONDecodeError, yaml.YAMLError, ValidationError, SchemaError):
-                # Validation failed for this version, try next version
-                all_valid = False
-                break
-            except Exception as e:
-                log.debug(f"Unexpected error with version {version}: {e}")
-                all_valid = False
-                break
-
-        if all_valid:
-            log.info(f"Found compatible schema version {version} for scope {scope}")
+    # Key each file by its stat signature so parses and results are reused until
+    # it changes; parse now so unreadable files fail up front
+    file_keys = {}
+    for yaml_file in yaml_files:
+        try:
+            st = os.stat(yaml_file)
+            file_keys[yaml_file] = (os.fspath(yaml_file), st.st_mtime_ns, st.st_size)
+            _load_file_cached(*file_keys[yaml_file])
+        except (OSError, yaml.YAMLError) as e:
+            log.warning(f"Could not read {yaml_file.name}: {e}")
+            return "0.0.0"
+
+    # Convert filename to schema name: filename.yml -> scope_filename.schema.json
+    schema_names = {yaml_file: f"{scope_prefix}_{yaml_file.stem}.schema.json" for yaml_file in file_keys}
+
+    def is_valid(yaml_file: Path, version: str) -> bool:
+        return _validate_file_cached(*file_keys[yaml_file], version, schema_names[yaml_file])
+
+    # Data written by this version of Prism is the common case: one check per
+    # file (stopping at the first failure) settles it. It is preferred over any
+    # newer schema that happens to accept the same data.
+    if APP_SCHEMA_VERSION in schema_versions and all(is_valid(yaml_file, APP_SCHEMA_VERSION) for yaml_file in file_keys):
+        log.info("Found compatible schema version %s for scope %s", APP_SCHEMA_VERSION, scope)
+        return APP_SCHEMA_VERSION
+
+    def first_hit(yaml_file: Path) -> int | None:
+        return next((i for i, version in enumerate(schema_versions) if is_valid(yaml_file, version)), None)
+
+    # Find each file's newest valid version, stopping at the first hit. No version
+    # newer than the oldest of these can validate every file, so the search for a
+    # common version starts there. Validation is pure Python and holds the GIL, so
+    # files are checked one after another rather than on threads.
+    hits = {yaml_file: first_hit(yaml_file) for yaml_file in file_keys}
+
+    # Failures are only reported if the whole search fails, so just note the file here.
+    unmatched = next((yaml_file for yaml_file, hit in hits.items() if hit is None), None)
+    oldest_hit = len(schema_versions) if unmatched is not None else max(hits.values())
+
+    # Try each remaining schema version from latest to oldest, stopping at the first failing file
+    for version in schema_versions[oldest_hit:]:
+        if all(is_valid(yaml_file, version) for yaml_file in file_keys):
+            log.info("Found compatible schema version %s for scope %s", version, scope)
             return version
 
-    log.warning(f"No compatible schema version found for scope {'"user"' if scope == 1 else '"project"'}")
+    if unmatched is not None:
+        log.debug("%s matches no schema version", unmatched.name)
+    log.warning("No compatible schema version found for scope \"%s\"", scope_prefix)
     return "0.0.0"
 
-def validate_scope_schema(scope: int, version : str = APP_SCHEMA_VERSION) -> bool:
+def check_scope_schema(scope: int, version : str = APP_SCHEMA_VERSION) -> tuple:
     """
-    Validate all files in the given scope against their current schema versions.
+    Check all files in the given scope against a schema version.
+
+    Problems are sorted as they are found: errors make the scope invalid,
+    warnings (a missing or empty data directory) do not.
 
     Args:
         scope: Either PROJECT_SCOPE or USER_SCOPE
+        version: The schema version to check against
 
     Returns:
-        True if all files are valid, False otherwise
+        An (errors, warnings) tuple of message lists. The scope is valid when
+        errors is empty.
     """
-    # Determine the data directory, scope prefix, and meta file based on scope
+    errors = []
+    warnings = []
+
+    # Determine the data directory and scope prefix based on scope
     if scope == PROJECT_SCOPE:
         data_dir = PROJECT_DATA_DIR
         scope_prefix = "project"
@@ -248,59 +436,79 @@ def validate_scope_schema(scope: int, version : str = APP_SCHEMA_VERSION) -> boo
         data_dir = USER_DATA_DIR
         scope_prefix = "user"
     else:
-        log.error(f"Invalid scope: {scope}")
-        return False
+        errors.append(f"Invalid scope: {scope}")
+        return (errors, warnings)
 
-    if not data_dir.exists():
-        log.warning(f"Data directory does not exist: {data_dir}")
-        return False
+    # Find all YAML files in the data directory (one directory read, no per-file stat)
+    yaml_files = _list_yaml_files(data_dir)
+    if yaml_files is None:
+        errors.append(f"Data directory does not exist: {data_dir}")
+        return (errors, warnings)
 
-    # Find all YAML files in the data directory
-    yaml_files = list(data_dir.glob("*.yml"))
     if not yaml_files:
-        log.warning(f"No YAML files found in {data_dir}")
-        return True  # Empty directory is considered valid
+        warnings.append(f"No YAML files found in {data_dir}")
+        return (errors, warnings)  # Empty directory is considered valid
+
+    # Files unchanged since they last passed against this version need no checking
+    stamps = _file_stamps(yaml_files)
+    if stamps is not None and _is_validated(data_dir, version, stamps):
+        log.debug("Scope %s unchanged since last validated against %s", scope, version)
+        return (errors, warnings)
 
     log.info(f"Validating {len(yaml_files)} files in scope {scope} against schema version {version}...")
 
+    from jsonschema import ValidationError, SchemaError
+
     # Validate each file against the current schema version
-    all_valid = True
     for yaml_file in yaml_files:
         # Convert filename to schema name: filename.yml -> scope_filename.schema.json
         base_name = yaml_file.stem  # gets 'bugs' from 'bugs.yml'
         schema_name = f"{scope_prefix}_{base_name}.schema.json"
 
         try:
-            schema = _load_schema(version, schema_name)
-            with open(yaml_file, 'r') as f:
-                data = yaml.safe_load(f)
+            data = load_file(yaml_file)
 
             # Perform validation
-            validate(instance=data, schema=schema)
+            _validate_instance(data, version, schema_name)
             log.debug(f"✓ {yaml_file.name} is valid")
 
         except FileNotFoundError:
-            log.error(f"Schema file '{schema_name}' not found for version {version}")
-            all_valid = False
+            errors.append(f"Schema file '{schema_name}' not found for version {version}")
         except json.JSONDecodeError:
-            log.error(f"Schema file '{schema_name}' is not valid JSON")
-            all_valid = False
+            errors.append(f"Schema file '{schema_name}' is not valid JSON")
         except yaml.YAMLError as e:
-            log.error(f"File {yaml_file.name} is not valid YAML: {e}")
-            all_valid = False
+            errors.append(f"File {yaml_file.name} is not valid YAML: {e}")
         except ValidationError as e:
-            log.error(f"File {yaml_file.name} FAILED validation: {e.message}")
-            all_valid = False
+            errors.append(f"File {yaml_file.name} FAILED validation: {e.message}")
         except SchemaError as e:
-            log.error(f"Schema '{schema_name}' is invalid: {e.message}")
-            all_valid = False
+            errors.append(f"Schema '{schema_name}' is invalid: {e.message}")
         except Exception as e:
-            log.error(f"Unexpected error validating {yaml_file.name}: {e}")
-            all_valid = False
+            errors.append(f"Unexpected error validating {yaml_file.name}: {e}")
 
-    if all_valid:
-        log.info(f"All files in scope {scope} are VALID against schema version {version}")
-    else:
+    if not errors and stamps is not None:
+        _mark_validated(data_dir, version, stamps)
+
+    return (errors, warnings)
+
+def validate_scope_schema(scope: int, version : str = APP_SCHEMA_VERSION) -> bool:
+    """
+    Validate all files in the given scope against their current schema versions.
+
+    Args:
+        scope: Either PROJECT_SCOPE or USER_SCOPE
+
+    Returns:
+        True if all files are valid, False otherwise
+    """
+    errors, warnings = check_scope_schema(scope, version)
+    for warning in warnings:
+        log.warning(warning)
+    for error in errors:
+        log.error(error)
+
+    if errors:
         log.error(f"Some files in scope {scope} FAILED validation against schema version {version}")
+    else:
+        log.info(f"All files in scope {scope} are VALID against schema version {version}")
 
-    return all_valid
+    return not errors
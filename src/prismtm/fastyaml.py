@@ -0,0 +1,101 @@
+"""
+YAML loading and dumping for Prism Task Manager.
+
+Prefers PyYAML's libyaml-backed ``CSafeLoader``/``CSafeDumper`` and falls back
+to the pure-Python safe classes when PyYAML was built without libyaml.
+"""
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    HAS_LIBYAML = False
+
+# Layout shared by every YAML file Prism writes
+DUMP_OPTIONS = {
+    'default_flow_style': False,
+    'sort_keys': False,
+    'indent': 2,
+    'allow_unicode': True,
+}
+
+
+def safe_load(stream):
+    """Parse a YAML string or stream with the fastest available safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_file(path):
+    """
+    Parse a YAML file with the fastest available safe loader.
+
+    The file is read as raw bytes in one call; the loader detects the encoding
+    itself, so no text-mode decoding layer sits in between.
+    """
+    with open(path, 'rb') as f:
+        return safe_load(f.read())
+
+
+def safe_dump(data, stream=None, **kwargs):
+    """
+    Serialize data to YAML with the fastest available safe dumper.
+
+    Uses DUMP_OPTIONS unless overridden by keyword arguments.
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **{**DUMP_OPTIONS, **kwargs})
+
+
+def _has_shared_containers(data):
+    """Whether any dict or list appears more than once in data (safe_dump anchors those)."""
+    seen = set()
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            children = value.values()
+        elif isinstance(value, list):
+            children = value
+        else:
+            continue
+        if id(value) in seen:
+            return True
+        seen.add(id(value))
+        stack.extend(children)
+    return False
+
+
+def safe_dump_cached(data, fragments):
+    """
+    Serialize a mapping to UTF-8 YAML, re-emitting only what changed.
+
+    Each top-level value, and each item of a top-level list, is dumped on its
+    own and kept in fragments (a dict owned by the caller, updated in place)
+    keyed by the value's repr. On later calls an unchanged value reuses its
+    bytes, so one edited item costs one item's worth of emitting. The repr
+    tells equal values of different types apart (1 and True, say), and data
+    that shares a dict or list between places is dumped whole, since
+    safe_dump writes those as anchors that span fragments. The result is
+    always byte-for-byte what safe_dump(data, encoding='utf-8') gives.
+    """
+    if not data or _has_shared_containers(data):
+        return safe_dump(data, encoding='utf-8')
+
+    def fragment(key, value, piece):
+        cached = fragments.get(key)
+        value_repr = repr(value)
+        if cached is None or cached[0] != value_repr:
+            cached = fragments[key] = (value_repr, safe_dump(piece, encoding='utf-8'))
+        return cached[1]
+
+    parts = []
+    for key, value in data.items():
+        if isinstance(value, list) and value:
+            # Block sequences under a top-level key are not indented, so each
+            # item dumps the same alone as in place; the first carries the key
+            parts.append(fragment((key, 0), value[0], {key: value[:1]}))
+            parts.extend(fragment((key, i), value[i], value[i:i + 1]) for i in range(1, len(value)))
+        else:
+            parts.append(fragment(key, value, {key: value}))
+    return b''.join(parts)
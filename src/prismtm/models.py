@@ -1,8 +1,8 @@
 from pydantic import BaseModel, Field, field_validator, model_validator
 from datetime import datetime, timedelta
-import yaml
+from prismtm.fastyaml import safe_load, safe_dump
 from enum import Enum
-from typing import Optional, List, Dict, Union, Dict, Any
+from typing import Optional, List, Dict, Union, Dict, Any, IO
 import re
 
 class BugSeverity(Enum):
@@ -83,10 +83,14 @@ class BaseYAMLModel(BaseModel):
         """Convert model to YAML string."""
         return self.model_dump(mode='json', exclude_none=True)
 
+    def to_yaml(self) -> str:
+        """Convert model to YAML string."""
+        return safe_dump(self.to_dict())
+
     @classmethod
-    def from_yaml(cls, yaml_str: str) -> 'BaseYAMLModel':
-        """Create model instance from YAML string."""
-        data = yaml.safe_load(yaml_str)
+    def from_yaml(cls, yaml_str: Union[str, bytes, IO[str]]) -> 'BaseYAMLModel':
+        """Create model instance from a YAML string, raw bytes or open text stream."""
+        data = safe_load(yaml_str)
         return cls.model_validate(data)
 
 class TaskTree(BaseYAMLModel):
@@ -1,4 +1,19 @@
+import functools
+
 VERSION = "0.2.0"
 APP_SCHEMA_VERSION = "0.1.0"
 
 __version__ = VERSION
+
+@functools.lru_cache(maxsize=None)
+def version_key(version: str) -> tuple:
+    """
+    Sort key for schema versions, with or without the 'v' of a schema directory name.
+
+    Schema versions are plain 'X.Y.Z' integers (no pre-release or dev tags),
+    so a tuple of ints orders them correctly without packaging.version. Keys
+    are cached, so rescans and comparisons never re-parse a version string.
+    """
+    if version.startswith('v'):
+        version = version[1:]
+    return tuple(int(part) for part in version.split('.'))
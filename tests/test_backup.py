@@ -0,0 +1,108 @@
+"""Unit tests for creating and restoring backups."""
+
+import pytest
+from src.prismtm.data.backup import BackupManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """A BackupManager whose project and user directories live under tmp_path."""
+    project_dir = tmp_path / ".prsm"
+    user_dir = tmp_path / "share" / "data"
+    project_dir.mkdir()
+    user_dir.mkdir(parents=True)
+    monkeypatch.setattr(BackupManager, "PRISM_PROJECT_DIR", project_dir)
+    monkeypatch.setattr(BackupManager, "PROJECT_BACKUP_DIR", project_dir / "backups")
+    monkeypatch.setattr(BackupManager, "PRISM_USER_DIR", user_dir)
+    monkeypatch.setattr(BackupManager, "USER_BACKUP_DIR", tmp_path / "share" / "backups")
+    return BackupManager()
+
+
+def _write_files(directory, contents):
+    for name, text in contents.items():
+        (directory / name).write_text(text)
+
+
+def _read_files(directory):
+    return {path.name: path.read_text() for path in directory.iterdir() if path.is_file()}
+
+
+class TestProjectBackup:
+    """Test project backups and restores."""
+
+    def test_restore(self, manager):
+        """Test a full restore brings back the backed-up files and keeps both backups."""
+        project_dir = BackupManager.PRISM_PROJECT_DIR
+        _write_files(project_dir, {"tasktree.yml": "tree", "bugs.yml": "bugs"})
+        backup_dir = manager.backup_project("snap")
+        assert _read_files(backup_dir).keys() == {"tasktree.yml", "bugs.yml", "backups.json"}
+
+        _write_files(project_dir, {"tasktree.yml": "edited", "time.yml": "new"})
+        assert manager.restore_project_backup(backup_dir.name)
+
+        assert _read_files(project_dir) == {"tasktree.yml": "tree", "bugs.yml": "bugs"}
+
+        # The backup restored from is left as it was
+        assert _read_files(backup_dir).keys() == {"tasktree.yml", "bugs.yml", "backups.json"}
+        assert (backup_dir / "tasktree.yml").read_text() == "tree"
+
+        # The state before the restore was saved first
+        safety = [backup for backup in manager.list_project_backups()
+                  if backup["backup_id"] != backup_dir.name]
+        assert len(safety) == 1
+        assert safety[0]["backup_id"].endswith(f"pre_restore_{backup_dir.name}")
+        saved = _read_files(safety[0]["backup_folder"])
+        del saved["backups.json"]
+        assert saved == {"tasktree.yml": "edited", "bugs.yml": "bugs", "time.yml": "new"}
+
+    def test_restore_selected_files(self, manager):
+        """Test a restore limited to some files leaves the others alone."""
+        project_dir = BackupManager.PRISM_PROJECT_DIR
+        _write_files(project_dir, {"tasktree.yml": "tree", "bugs.yml": "bugs"})
+        backup_dir = manager.backup_project("snap")
+
+        _write_files(project_dir, {"tasktree.yml": "edited", "bugs.yml": "edited bugs"})
+        assert manager.restore_project_backup(backup_dir.name, files={"tasktree.yml"})
+
+        assert _read_files(project_dir) == {"tasktree.yml": "tree", "bugs.yml": "edited bugs"}
+        assert (backup_dir / "bugs.yml").read_text() == "bugs"
+        assert len(manager.list_project_backups()) == 2
+
+    def test_missing_backup(self, manager):
+        """Test restoring an unknown backup raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            manager.restore_project_backup("nope")
+
+
+class TestUserBackup:
+    """Test user backups and restores."""
+
+    def test_restore(self, manager):
+        """Test a full restore brings back the backed-up files and keeps both backups."""
+        user_dir = BackupManager.PRISM_USER_DIR
+        _write_files(user_dir, {"bugs.yml": "bugs"})
+        backup_dir = manager.backup_user("snap")
+
+        _write_files(user_dir, {"bugs.yml": "edited", "extra.yml": "new"})
+        assert manager.restore_user_backup(backup_dir.name)
+
+        assert _read_files(user_dir) == {"bugs.yml": "bugs"}
+        assert (backup_dir / "bugs.yml").read_text() == "bugs"
+
+        safety = [backup for backup in manager.list_user_backups()
+                  if backup["backup_id"] != backup_dir.name]
+        assert len(safety) == 1
+        assert (safety[0]["backup_folder"] / "bugs.yml").read_text() == "edited"
+        assert (safety[0]["backup_folder"] / "extra.yml").read_text() == "new"
+
+    def test_restore_selected_files(self, manager):
+        """Test a restore limited to some files leaves the others alone."""
+        user_dir = BackupManager.PRISM_USER_DIR
+        _write_files(user_dir, {"bugs.yml": "bugs", "projects.yml": "projects"})
+        backup_dir = manager.backup_user("snap")
+
+        _write_files(user_dir, {"bugs.yml": "edited", "projects.yml": "edited projects"})
+        assert manager.restore_user_backup(backup_dir.name, files={"bugs.yml"})
+
+        assert _read_files(user_dir) == {"bugs.yml": "bugs", "projects.yml": "edited projects"}
+        assert (backup_dir / "projects.yml").read_text() == "projects"
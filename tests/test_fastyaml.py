@@ -0,0 +1,63 @@
+"""Unit tests for the YAML loading and dumping helpers."""
+
+import yaml
+from src.prismtm import fastyaml
+from src.prismtm.fastyaml import safe_dump, safe_dump_cached
+from src.prismtm.models import TaskTree, TaskStatus
+
+
+class TestIncrementalDump:
+    """Test incremental YAML serialization of model data."""
+
+    def test_matches_full_dump(self):
+        """Test reused fragments produce the same bytes as a full dump."""
+        tree = TaskTree(
+            current_task_path="pa/0.1.x/0.1.1/task1",
+            nav_path="pa",
+            phases=[
+                {"name": name, "version_match": "0.*.*", "milestones": [
+                    {"versions": "0.1.x", "reason": "Long reason " * 12, "blocks": []}
+                ]}
+                for name in ("pa", "alpha", "beta")
+            ]
+        )
+        fragments = {}
+        assert safe_dump_cached(tree.to_dict(), fragments) == safe_dump(tree.to_dict(), encoding='utf-8')
+
+        tree.phases[1].status = TaskStatus.COMPLETED
+        tree.nav_path = "alpha"
+        assert safe_dump_cached(tree.to_dict(), fragments) == safe_dump(tree.to_dict(), encoding='utf-8')
+
+        assert safe_dump_cached({}, fragments) == safe_dump({}, encoding='utf-8')
+
+    def test_equal_values_of_different_types(self):
+        """Test a value swapped for an equal one of another type is re-emitted."""
+        fragments = {}
+        safe_dump_cached({"flag": 1, "items": [1, 0]}, fragments)
+
+        data = {"flag": True, "items": [True, False]}
+        assert safe_dump_cached(data, fragments) == safe_dump(data, encoding='utf-8')
+
+    def test_shared_references(self):
+        """Test data sharing a dict between places keeps the anchors a full dump writes."""
+        shared = {"name": "task1"}
+        fragments = {}
+        safe_dump_cached({"current": {"name": "task1"}, "tasks": [{"name": "task1"}]}, fragments)
+
+        data = {"current": shared, "tasks": [shared]}
+        assert b"&id001" in safe_dump(data, encoding='utf-8')
+        assert safe_dump_cached(data, fragments) == safe_dump(data, encoding='utf-8')
+
+
+class TestFastYAML:
+    """Test the YAML backend selection."""
+
+    def test_uses_libyaml_when_available(self):
+        """Test the C loader and dumper are picked whenever PyYAML has libyaml."""
+        assert fastyaml.HAS_LIBYAML == hasattr(yaml, 'CSafeLoader')
+        if fastyaml.HAS_LIBYAML:
+            assert fastyaml.SafeLoader is yaml.CSafeLoader
+            assert fastyaml.SafeDumper is yaml.CSafeDumper
+        else:
+            assert fastyaml.SafeLoader is yaml.SafeLoader
+            assert fastyaml.SafeDumper is yaml.SafeDumper
@@ -0,0 +1,33 @@
+"""Unit tests for the schema migration generator."""
+
+from migration_generator import MigrationGenerator, SchemaDiff
+
+
+class TestDetectFieldRenames:
+    """Test rename detection between removed and added fields."""
+
+    def test_best_match_wins_contested_field(self, tmp_path):
+        """Test two removed fields competing for one added field: only the closer is renamed."""
+        generator = MigrationGenerator(str(tmp_path))
+        diff = SchemaDiff("v0.1.0", "v0.2.0")
+        # Both clear the similarity threshold; user_name is the closer match,
+        # though usrnme comes first in schema order
+        diff.removed_fields = {"usrnme": {"type": "string"}, "user_name": {"type": "string"}}
+        diff.added_fields = {"username": {"type": "string"}}
+
+        generator.detect_field_renames(diff)
+
+        assert diff.renamed_fields == {"user_name": "username"}
+        # The loser stays a plain removal
+        assert "usrnme" in diff.removed_fields
+
+    def test_requires_matching_type(self, tmp_path):
+        """Test a similar name with a different type is not taken as a rename."""
+        generator = MigrationGenerator(str(tmp_path))
+        diff = SchemaDiff("v0.1.0", "v0.2.0")
+        diff.removed_fields = {"user_name": {"type": "integer"}}
+        diff.added_fields = {"username": {"type": "string"}}
+
+        generator.detect_field_renames(diff)
+
+        assert diff.renamed_fields == {}
@@ -199,6 +199,16 @@ class TestTaskTree:
         assert tree.nav_path == ""
         assert len(tree.phases) == 0
 
+    def test_yaml_round_trip(self):
+        """Test serializing a task tree to YAML and parsing it back."""
+        tree = TaskTree(
+            current_task_path="",
+            nav_path="",
+            phases=[]
+        )
+        restored = TaskTree.from_yaml(tree.to_yaml())
+        assert restored == tree
+
     def test_path_validation(self):
         """Test path validation in TaskTree."""
         # Valid paths
@@ -503,3 +513,14 @@ class TestTimeSession:
             session_type=SessionType.PAUSE
         )
         assert pause_session.session_type == SessionType.PAUSE
+
+
+class TestEmptyTemplates:
+    """Test the empty data files written by `prsm init`."""
+
+    def test_templates_match_models(self):
+        """Test the precomputed YAML matches what the empty models serialize to."""
+        from src.prismtm.cli import _EMPTY_YAMLS
+        assert _EMPTY_YAMLS['tasktree.yml'] == TaskTree(current_task_path="", nav_path="").to_yaml().encode('utf-8')
+        assert _EMPTY_YAMLS['time.yml'] == ProjectTimeTracker().to_yaml().encode('utf-8')
+        assert _EMPTY_YAMLS['bugs.yml'] == ProjectBugList().to_yaml().encode('utf-8')
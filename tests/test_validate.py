@@ -0,0 +1,67 @@
+"""Unit tests for schema validation of data directories."""
+
+import pytest
+from src.prismtm.cli import _EMPTY_YAMLS
+from src.prismtm.data import validate
+from src.prismtm.version import APP_SCHEMA_VERSION
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """A valid project data directory that check_scope_schema reads."""
+    data_dir = tmp_path / ".prsm"
+    data_dir.mkdir()
+    for name, content in _EMPTY_YAMLS.items():
+        (data_dir / name).write_bytes(content)
+    monkeypatch.setattr(validate, "PROJECT_DATA_DIR", data_dir)
+    return data_dir
+
+
+@pytest.fixture
+def validated_files(monkeypatch):
+    """Records the schema name of every instance check_scope_schema validates."""
+    checked = []
+    validate_instance = validate._validate_instance
+
+    def record(data, schema_version, schema_name):
+        checked.append(schema_name)
+        return validate_instance(data, schema_version, schema_name)
+
+    monkeypatch.setattr(validate, "_validate_instance", record)
+    return checked
+
+
+class TestValidatedRecord:
+    """Test that unchanged, already validated files are not validated again."""
+
+    def test_second_check_skips_validation(self, project_dir, validated_files):
+        """Test a passing scope is recorded and a repeat check skips validation."""
+        assert validate.check_scope_schema(validate.PROJECT_SCOPE, APP_SCHEMA_VERSION) == ([], [])
+        assert len(validated_files) == len(_EMPTY_YAMLS)
+        assert (project_dir / validate.VALIDATED_FILE).exists()
+
+        validated_files.clear()
+        assert validate.check_scope_schema(validate.PROJECT_SCOPE, APP_SCHEMA_VERSION) == ([], [])
+        assert validated_files == []
+
+    def test_edited_file_is_revalidated(self, project_dir, validated_files):
+        """Test changing a file's contents forces validation again."""
+        validate.check_scope_schema(validate.PROJECT_SCOPE, APP_SCHEMA_VERSION)
+        validated_files.clear()
+
+        (project_dir / "tasktree.yml").write_text("current_task_path: ''\nnav_path: ''\n")
+        assert validate.check_scope_schema(validate.PROJECT_SCOPE, APP_SCHEMA_VERSION) == ([], [])
+        assert len(validated_files) == len(_EMPTY_YAMLS)
+
+        (project_dir / "tasktree.yml").write_text("phases: []\n")
+        errors, _ = validate.check_scope_schema(validate.PROJECT_SCOPE, APP_SCHEMA_VERSION)
+        assert errors
+
+    def test_other_version_is_revalidated(self, project_dir, validated_files):
+        """Test checking against a different schema version ignores the record."""
+        validate.check_scope_schema(validate.PROJECT_SCOPE, APP_SCHEMA_VERSION)
+        validated_files.clear()
+
+        errors, _ = validate.check_scope_schema(validate.PROJECT_SCOPE, "99.0.0")
+        assert len(validated_files) == len(_EMPTY_YAMLS)
+        assert errors